@@ -8,17 +8,34 @@ Includes WebSocket support for real-time updates and gamification features.
 from __future__ import annotations
 
 import asyncio
+import csv
+import functools
+import heapq
+import io
+import itertools
 import json
 import time
 import uuid
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator
-
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, status
+from operator import attrgetter
+from typing import Any
+
+from fastapi import (
+    FastAPI,
+    HTTPException,
+    Query,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 
 from smallworld import __version__
 from smallworld.core.graph_builder import GraphBuilder
@@ -52,11 +69,15 @@ class ConnectionManager:
             self.active_connections.remove(websocket)
 
     async def broadcast(self, message: dict[str, Any]) -> None:
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                pass
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_json(message) for connection in connections),
+            return_exceptions=True,
+        )
+        # Sockets that failed to send are dead; stop broadcasting to them
+        for connection, result in zip(connections, results, strict=True):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
 
 
 # Gamification models
@@ -90,6 +111,8 @@ class Achievement(BaseModel):
 
 class SimulationResult(BaseModel):
     id: str
+    # Internal ordering key behind the history cursor; never serialized
+    sequence: int = Field(exclude=True)
     user_id: str
     original_path_length: float
     optimized_path_length: float
@@ -99,9 +122,31 @@ class SimulationResult(BaseModel):
     points_earned: int
 
 
+class SimulationExport(BaseModel):
+    export_date: str
+    total_simulations: int
+    simulations: list[SimulationResult]
+
+
+# Column order of the /export/csv payload
+CSV_EXPORT_COLUMNS = (
+    "id",
+    "user_id",
+    "original_path_length",
+    "optimized_path_length",
+    "improvement_percent",
+    "shortcuts_applied",
+    "timestamp",
+    "points_earned",
+)
+
+
 # In-memory stores (in production, use a database)
 user_scores: dict[str, UserScore] = {}
 simulation_history: list[SimulationResult] = []
+simulation_history_by_user: defaultdict[str, list[SimulationResult]] = defaultdict(list)
+# Monotonic ids keep every history list sorted by sequence, so pages can be bisected
+simulation_sequence = itertools.count(1)
 achievements_definitions: list[Achievement] = [
     Achievement(
         id="first_optimization",
@@ -144,10 +189,59 @@ achievements_definitions: list[Achievement] = [
         points=200,
     ),
 ]
+achievements_by_id: dict[str, Achievement] = {a.id: a for a in achievements_definitions}
+# The catalog never changes at runtime, so it is serialized once at import
+_ACHIEVEMENTS_JSON = TypeAdapter(list[Achievement]).dump_json(achievements_definitions)
 
 # Global connection manager
 manager = ConnectionManager()
 
+# Short-lived memo for read-mostly gamification endpoints. Entries are keyed by
+# endpoint and query parameters and dropped whenever a score changes.
+RESPONSE_CACHE_TTL_SECONDS = 5.0
+response_cache: dict[tuple[Any, ...], tuple[float, bytes]] = {}
+
+# Upper bound for /leaderboard?limit=, which also bounds the cache's key space
+LEADERBOARD_MAX_LIMIT = 100
+
+
+def invalidate_response_cache() -> None:
+    """Drop all memoised gamification responses after a score change."""
+    response_cache.clear()
+
+
+def ttl_cached(
+    func: Callable[..., Awaitable[Response]],
+) -> Callable[..., Awaitable[Response]]:
+    """
+    Memoise an async route handler for RESPONSE_CACHE_TTL_SECONDS.
+
+    Only the rendered JSON body is stored; every hit gets a fresh Response.
+    Expired entries are evicted whenever a new entry is stored.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(**kwargs: Any) -> Response:
+        key = (func.__name__, *sorted(kwargs.items()))
+        now = time.monotonic()
+        cached = response_cache.get(key)
+        if cached is not None and now - cached[0] < RESPONSE_CACHE_TTL_SECONDS:
+            return Response(content=cached[1], media_type="application/json")
+        result = await func(**kwargs)
+        expired = [
+            k for k, (at, _) in response_cache.items() if now - at >= RESPONSE_CACHE_TTL_SECONDS
+        ]
+        for k in expired:
+            del response_cache[k]
+        response_cache[key] = (now, bytes(result.body))
+        return result
+
+    return wrapper
+
+
+# Validates all node metric rows in one call instead of one model per node
+_NODE_METRICS_ADAPTER = TypeAdapter(list[NodeMetricsResponse])
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -184,6 +278,8 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Browsers only let scripts read response headers listed here
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Register routes
@@ -267,10 +363,9 @@ def register_routes(app: FastAPI) -> None:
             shortcuts = optimizer.find_shortcuts(k=request.options.k, policy=policy)
 
             # Build response
-            node_metrics_list = [
-                NodeMetricsResponse(**nm.to_dict())
-                for nm in node_metrics.values()
-            ]
+            node_metrics_list = _NODE_METRICS_ADAPTER.validate_python(
+                [nm.to_dict() for nm in node_metrics.values()]
+            )
 
             shortcuts_list = [
                 ShortcutSuggestion(
@@ -371,24 +466,28 @@ def register_routes(app: FastAPI) -> None:
 
     # Gamification endpoints
     @app.get("/leaderboard", response_model=list[LeaderboardEntry])
-    async def get_leaderboard(limit: int = 10) -> list[LeaderboardEntry]:
+    @ttl_cached
+    async def get_leaderboard(
+        limit: int = Query(default=10, ge=1, le=LEADERBOARD_MAX_LIMIT),
+    ) -> JSONResponse:
         """Get the top users on the leaderboard."""
-        sorted_users = sorted(
+        sorted_users = heapq.nlargest(
+            limit,
             user_scores.values(),
-            key=lambda x: x.score,
-            reverse=True,
-        )[:limit]
-        return [
-            LeaderboardEntry(
-                rank=i + 1,
-                user_id=user.user_id,
-                username=user.username,
-                score=user.score,
-                optimizations=user.optimizations,
-                streak=user.streak,
-            )
+            key=attrgetter("score"),
+        )
+        # Scores are already validated UserScore data; skip per-entry model builds
+        return JSONResponse(content=[
+            {
+                "rank": i + 1,
+                "user_id": user.user_id,
+                "username": user.username,
+                "score": user.score,
+                "optimizations": user.optimizations,
+                "streak": user.streak,
+            }
             for i, user in enumerate(sorted_users)
-        ]
+        ])
 
     @app.get("/users/{user_id}/score", response_model=UserScore)
     async def get_user_score(user_id: str) -> UserScore:
@@ -400,6 +499,7 @@ def register_routes(app: FastAPI) -> None:
                 username=f"user_{user_id[:8]}",
                 last_active=datetime.now(timezone.utc).isoformat(),
             )
+            invalidate_response_cache()
         return user_scores[user_id]
 
     @app.post("/users/{user_id}/score", response_model=UserScore)
@@ -428,12 +528,14 @@ def register_routes(app: FastAPI) -> None:
         if user.optimizations == 1 and "first_optimization" not in user.achievements:
             user.achievements.append("first_optimization")
             new_achievements.append("first_optimization")
-            user.score += 10
+            user.score += achievements_by_id["first_optimization"].points
 
         if user.optimizations >= 100 and "hundred_optimizations" not in user.achievements:
             user.achievements.append("hundred_optimizations")
             new_achievements.append("hundred_optimizations")
-            user.score += 500
+            user.score += achievements_by_id["hundred_optimizations"].points
+
+        invalidate_response_cache()
 
         # Broadcast update if there are new achievements
         if new_achievements:
@@ -446,9 +548,9 @@ def register_routes(app: FastAPI) -> None:
         return user
 
     @app.get("/achievements", response_model=list[Achievement])
-    async def get_achievements() -> list[Achievement]:
+    async def get_achievements() -> Response:
         """Get all available achievements."""
-        return achievements_definitions
+        return Response(content=_ACHIEVEMENTS_JSON, media_type="application/json")
 
     @app.post("/simulations", response_model=SimulationResult)
     async def record_simulation(
@@ -469,6 +571,7 @@ def register_routes(app: FastAPI) -> None:
 
         result = SimulationResult(
             id=str(uuid.uuid4()),
+            sequence=next(simulation_sequence),
             user_id=user_id,
             original_path_length=round(original_path_length, 4),
             optimized_path_length=round(optimized_path_length, 4),
@@ -479,6 +582,7 @@ def register_routes(app: FastAPI) -> None:
         )
 
         simulation_history.append(result)
+        simulation_history_by_user[user_id].append(result)
 
         # Update user score
         await update_user_score(user_id, points, optimization_completed=True)
@@ -489,7 +593,8 @@ def register_routes(app: FastAPI) -> None:
                 user = user_scores[user_id]
                 if "perfect_score" not in user.achievements:
                     user.achievements.append("perfect_score")
-                    user.score += 200
+                    user.score += achievements_by_id["perfect_score"].points
+                    invalidate_response_cache()
                     await manager.broadcast({
                         "type": "achievement_unlocked",
                         "user_id": user_id,
@@ -506,21 +611,37 @@ def register_routes(app: FastAPI) -> None:
 
     @app.get("/simulations", response_model=list[SimulationResult])
     async def get_simulation_history(
+        response: Response,
         user_id: str | None = None,
         limit: int = 50,
+        cursor: int | None = None,
     ) -> list[SimulationResult]:
-        """Get simulation history, optionally filtered by user."""
+        """
+        Get simulation history, newest first, optionally filtered by user.
+
+        Pass the ``X-Next-Cursor`` header of one page as ``cursor`` to fetch
+        the records recorded before it.
+        """
         results = simulation_history
         if user_id:
-            results = [r for r in results if r.user_id == user_id]
-        return sorted(results, key=lambda x: x.timestamp, reverse=True)[:limit]
+            results = simulation_history_by_user.get(user_id, [])
+
+        end = len(results)
+        if cursor is not None:
+            end = bisect_left(results, cursor, key=attrgetter("sequence"))
+        start = max(end - limit, 0)
+        page = results[start:end][::-1]
+
+        if start > 0 and page:
+            response.headers["X-Next-Cursor"] = str(page[-1].sequence)
+        return page
 
     # Export endpoint
     @app.get("/export/{format}")
     async def export_analysis(
         format: str,
         user_id: str | None = None,
-    ) -> JSONResponse:
+    ) -> Response:
         """Export analysis data in various formats."""
         if format not in ["json", "csv"]:
             raise HTTPException(
@@ -530,27 +651,25 @@ def register_routes(app: FastAPI) -> None:
 
         results = simulation_history
         if user_id:
-            results = [r for r in results if r.user_id == user_id]
+            results = simulation_history_by_user.get(user_id, [])
 
         if format == "json":
-            return JSONResponse(
-                content={
-                    "export_date": datetime.now(timezone.utc).isoformat(),
-                    "total_simulations": len(results),
-                    "simulations": [r.model_dump() for r in results],
-                }
+            # Serialized in pydantic-core, without intermediate dicts per record
+            export = SimulationExport(
+                export_date=datetime.now(timezone.utc).isoformat(),
+                total_simulations=len(results),
+                simulations=results,
             )
+            return Response(content=export.model_dump_json(), media_type="application/json")
         else:
-            # CSV format
-            csv_lines = [
-                "id,user_id,original_path_length,optimized_path_length,improvement_percent,shortcuts_applied,timestamp,points_earned"
-            ]
-            for r in results:
-                csv_lines.append(
-                    f"{r.id},{r.user_id},{r.original_path_length},{r.optimized_path_length},{r.improvement_percent},{r.shortcuts_applied},{r.timestamp},{r.points_earned}"
-                )
+            # CSV format; csv.writer also quotes user ids containing commas
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(CSV_EXPORT_COLUMNS)
+            writer.writerows(map(attrgetter(*CSV_EXPORT_COLUMNS), results))
+            # Rows are newline-joined, with no terminator after the last one
             return JSONResponse(
-                content={"csv": "\n".join(csv_lines)},
+                content={"csv": buffer.getvalue().removesuffix("\n")},
                 media_type="text/csv",
             )
 
@@ -6,6 +6,7 @@ Provides commands for analyzing service topologies from the command line.
 
 from __future__ import annotations
 
+import functools
 import json
 import sys
 from pathlib import Path
@@ -21,6 +22,7 @@ from smallworld.core.graph_builder import GraphBuilder
 from smallworld.core.metrics import MetricsCalculator
 from smallworld.core.shortcut_optimizer import PolicyConstraints, ShortcutOptimizer
 from smallworld.io.json_loader import JsonLoader, JsonLoaderError
+from smallworld.io.schemas import ServiceTopology
 
 app = typer.Typer(
     name="smallworld",
@@ -29,6 +31,38 @@ app = typer.Typer(
 )
 console = Console()
 
+# Parsed topologies kept in-process, keyed on path and modification time
+TOPOLOGY_CACHE_SIZE = 32
+
+
+def load_topology(path: Path) -> ServiceTopology:
+    """
+    Load a topology file, reusing the previous parse while it is unchanged.
+
+    Args:
+        path: Path to the topology JSON file
+
+    Returns:
+        Validated ServiceTopology
+
+    Raises:
+        JsonLoaderError: If the file cannot be read or is invalid
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return JsonLoader.load_from_file(path)
+    topology = _load_topology_cached(str(path), stat.st_mtime_ns, stat.st_size)
+    # Services and edges are frozen, so fresh lists keep callers from sharing mutations
+    return topology.model_copy(
+        update={"services": list(topology.services), "edges": list(topology.edges)}
+    )
+
+
+@functools.lru_cache(maxsize=TOPOLOGY_CACHE_SIZE)
+def _load_topology_cached(path: str, mtime_ns: int, size: int) -> ServiceTopology:
+    return JsonLoader.load_from_file(path)
+
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
@@ -88,7 +122,7 @@ def analyze(
     try:
         # Load topology
         with console.status("[bold green]Loading topology..."):
-            topology = JsonLoader.load_from_file(input_file)
+            topology = load_topology(input_file)
 
         if verbose:
             console.print(f"[green]Loaded {len(topology.services)} services, {len(topology.edges)} edges[/green]")
@@ -150,7 +184,7 @@ def metrics(
     and load distribution.
     """
     try:
-        topology = JsonLoader.load_from_file(input_file)
+        topology = load_topology(input_file)
         builder = GraphBuilder()
         graph = builder.build_from_topology(topology)
 
@@ -224,7 +258,7 @@ def validate(
     Checks if the file is valid JSON and conforms to the expected schema.
     """
     try:
-        topology = JsonLoader.load_from_file(input_file)
+        topology = load_topology(input_file)
         console.print("[green]Valid topology file![/green]")
         console.print(f"  Services: {len(topology.services)}")
         console.print(f"  Edges: {len(topology.edges)}")
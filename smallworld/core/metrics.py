@@ -12,6 +12,9 @@ Computes network metrics for service dependency graphs:
 
 from __future__ import annotations
 
+import heapq
+import math
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -19,7 +22,7 @@ import networkx as nx
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeMetrics:
     """Metrics for a single node (service)."""
 
@@ -97,6 +100,166 @@ class GraphMetrics:
         }
 
 
+def betweenness_centrality(graph: nx.DiGraph) -> dict[str, float]:
+    """
+    Normalized unweighted betweenness centrality (Brandes' algorithm).
+
+    Produces the same values as ``nx.betweenness_centrality(graph,
+    normalized=True)`` but runs the per-source BFS over integer-indexed
+    adjacency lists instead of NetworkX's dict-of-dicts, which roughly
+    halves the cost of the dominant O(n*m) loop.
+
+    Args:
+        graph: Directed graph to analyze
+
+    Returns:
+        Mapping of node to betweenness centrality.
+    """
+    nodes = list(graph.nodes())
+    n = len(nodes)
+    # No node can sit strictly between two others
+    if n < 3:
+        return dict.fromkeys(nodes, 0.0)
+
+    index = {node: i for i, node in enumerate(nodes)}
+    successors = [[index[w] for w in graph.successors(node)] for node in nodes]
+    totals = [0.0] * n
+
+    for source in range(n):
+        sigma = [0] * n
+        sigma[source] = 1
+        distance = [-1] * n
+        distance[source] = 0
+        predecessors: list[list[int]] = [[] for _ in range(n)]
+        order: list[int] = []
+        queue = deque([source])
+
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            next_distance = distance[v] + 1
+            for w in successors[v]:
+                if distance[w] < 0:
+                    distance[w] = next_distance
+                    queue.append(w)
+                if distance[w] == next_distance:
+                    sigma[w] += sigma[v]
+                    predecessors[w].append(v)
+
+        delta = [0.0] * n
+        for w in reversed(order):
+            coefficient = (1.0 + delta[w]) / sigma[w]
+            for v in predecessors[w]:
+                delta[v] += sigma[v] * coefficient
+            if w != source:
+                totals[w] += delta[w]
+
+    # Directed normalization, matching NetworkX
+    scale = 1.0 / ((n - 1) * (n - 2))
+    return {node: totals[i] * scale for i, node in enumerate(nodes)}
+
+
+def average_weighted_path_length(graph: nx.DiGraph, weight: str = "weight") -> float:
+    """
+    Mean shortest-path length over all reachable ordered pairs.
+
+    Runs Dijkstra from every node over integer-indexed adjacency lists,
+    summing distances as nodes are settled instead of building a
+    per-source distance dict. Unreachable pairs are skipped.
+
+    Args:
+        graph: Directed graph to analyze
+        weight: Edge attribute holding the length (missing means 1)
+
+    Returns:
+        Average path length, or 0.0 when no pair is reachable.
+    """
+    nodes = list(graph.nodes())
+    n = len(nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    adjacency = [
+        [(index[target], data.get(weight, 1)) for target, data in graph.adj[node].items()]
+        for node in nodes
+    ]
+
+    total_length = 0.0
+    count = 0
+    for source in range(n):
+        settled = [False] * n
+        best: dict[int, float] = {source: 0}
+        heap: list[tuple[float, int]] = [(0, source)]
+        while heap:
+            length, v = heapq.heappop(heap)
+            if settled[v]:
+                continue
+            settled[v] = True
+            if v != source:
+                total_length += length
+                count += 1
+            for w, edge_length in adjacency[v]:
+                candidate = length + edge_length
+                if not settled[w] and candidate < best.get(w, float("inf")):
+                    best[w] = candidate
+                    heapq.heappush(heap, (candidate, w))
+
+    return total_length / count if count > 0 else 0.0
+
+
+def pagerank(
+    graph: nx.DiGraph,
+    alpha: float = 0.85,
+    weight: str = "weight",
+    tol: float = 1.0e-6,
+    max_iter: int = 100,
+) -> dict[str, float]:
+    """
+    PageRank by power iteration over NumPy edge arrays.
+
+    Follows ``nx.pagerank`` (uniform teleport, dangling mass spread
+    uniformly, same stopping rule) but does not need SciPy, which
+    ``nx.pagerank`` imports for its sparse-matrix path. Each iteration
+    is a single ``np.bincount`` scatter over the edge list.
+
+    Args:
+        graph: Directed graph to analyze
+        alpha: Damping factor
+        weight: Edge attribute holding the weight (missing means 1)
+        tol: Convergence tolerance per node
+        max_iter: Maximum number of iterations
+
+    Returns:
+        Mapping of node to PageRank.
+
+    Raises:
+        nx.PowerIterationFailedConvergence: If max_iter is reached.
+    """
+    nodes = list(graph.nodes())
+    n = len(nodes)
+    if n == 0:
+        return {}
+
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = list(graph.edges(data=weight, default=1.0))
+    sources = np.array([index[u] for u, _, _ in edges], dtype=np.intp)
+    targets = np.array([index[v] for _, v, _ in edges], dtype=np.intp)
+    weights = np.array([w for _, _, w in edges], dtype=float)
+
+    out_weight = np.bincount(sources, weights=weights, minlength=n)
+    dangling = out_weight == 0
+    inverse = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+    share = weights * inverse[sources]
+
+    ranks = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = ranks
+        spread = np.bincount(targets, weights=previous[sources] * share, minlength=n)
+        ranks = alpha * (spread + previous[dangling].sum() / n) + (1.0 - alpha) / n
+        if np.abs(ranks - previous).sum() < n * tol:
+            return dict(zip(nodes, ranks.tolist(), strict=True))
+
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
 @dataclass
 class MetricsCalculator:
     """
@@ -145,7 +308,7 @@ class MetricsCalculator:
 
         # Betweenness centrality (normalized)
         try:
-            betweenness = nx.betweenness_centrality(self.graph, normalized=True)
+            betweenness = betweenness_centrality(self.graph)
         except Exception:
             betweenness = {n: 0.0 for n in self.graph.nodes()}
 
@@ -164,9 +327,9 @@ class MetricsCalculator:
 
         # PageRank
         try:
-            pagerank = nx.pagerank(self.graph, alpha=0.85)
+            pagerank_scores = pagerank(self.graph, alpha=0.85)
         except Exception:
-            pagerank = {n: 1.0 / self.graph.number_of_nodes() for n in self.graph.nodes()}
+            pagerank_scores = {n: 1.0 / self.graph.number_of_nodes() for n in self.graph.nodes()}
 
         # Load calculation
         incoming_load = self._calculate_incoming_load()
@@ -181,7 +344,7 @@ class MetricsCalculator:
                 betweenness_centrality=betweenness.get(node, 0.0),
                 closeness_centrality=closeness.get(node, 0.0),
                 clustering_coefficient=clustering.get(node, 0.0),
-                pagerank=pagerank.get(node, 0.0),
+                pagerank=pagerank_scores.get(node, 0.0),
                 incoming_load=incoming_load.get(node, 0.0),
                 outgoing_load=outgoing_load.get(node, 0.0),
             )
@@ -298,22 +461,7 @@ class MetricsCalculator:
     def _calculate_weighted_average_path_length(self) -> float:
         """Calculate average shortest path length using latency weights."""
         try:
-            total_length = 0.0
-            count = 0
-
-            for source in self.graph.nodes():
-                try:
-                    lengths = nx.single_source_dijkstra_path_length(
-                        self.graph, source, weight="weight"
-                    )
-                    for target, length in lengths.items():
-                        if source != target:
-                            total_length += length
-                            count += 1
-                except nx.NetworkXNoPath:
-                    continue
-
-            return total_length / count if count > 0 else 0.0
+            return average_weighted_path_length(self.graph)
         except Exception:
             return 0.0
 
@@ -349,33 +497,19 @@ class MetricsCalculator:
         Compares clustering and path length to equivalent random graph.
         Values > 1 indicate small-world properties.
         """
-        if path_length == 0 or n < 3:
+        # With no edges the random-graph clustering is 0 and the ratio undefined
+        if path_length == 0 or n < 3 or m == 0:
             return 0.0
 
-        # Expected values for Erdos-Renyi random graph
-        p = m / (n * (n - 1)) if n > 1 else 0
-
-        # Random clustering coefficient ≈ p
-        random_clustering = p
-
-        # Random path length ≈ ln(n) / ln(k) where k = average degree
-        avg_degree = 2 * m / n if n > 0 else 0
-        if avg_degree > 1:
-            random_path_length = np.log(n) / np.log(avg_degree)
-        else:
-            random_path_length = n / 2  # Fallback
-
-        if random_clustering == 0 or random_path_length == 0:
-            return 0.0
+        # Erdos-Renyi reference: clustering ≈ p, path length ≈ ln(n) / ln(k)
+        random_clustering = m / (n * (n - 1))
+        avg_degree = 2 * m / n
+        random_path_length = (
+            math.log(n) / math.log(avg_degree) if avg_degree > 1 else n / 2
+        )
 
         # Small-world coefficient = (C/C_random) / (L/L_random)
-        gamma = clustering / random_clustering if random_clustering > 0 else 0
-        # Note: lambda_ratio cannot be 0 here because:
-        # 1. path_length > 0 is guaranteed by check on line 352
-        # 2. random_path_length > 0 is guaranteed by check above
-        lambda_ratio = path_length / random_path_length
-
-        return gamma / lambda_ratio
+        return (clustering / random_clustering) / (path_length / random_path_length)
 
     def _identify_hubs_and_bottlenecks(
         self,
@@ -17,7 +17,7 @@ from typing import Any
 import networkx as nx
 import numpy as np
 
-from smallworld.core.metrics import MetricsCalculator
+from smallworld.core.metrics import GraphMetrics, MetricsCalculator
 
 
 class OptimizationGoal(str, Enum):
@@ -29,7 +29,16 @@ class OptimizationGoal(str, Enum):
     BALANCED = "balanced"  # Balance all objectives
 
 
-@dataclass
+# Objective weights (alpha: path length, beta: max betweenness, gamma: cost)
+GOAL_WEIGHTS: dict[OptimizationGoal, tuple[float, float, float]] = {
+    OptimizationGoal.LATENCY: (2.0, 0.5, 0.1),
+    OptimizationGoal.PATHS: (2.0, 0.3, 0.0),
+    OptimizationGoal.LOAD: (0.5, 2.0, 0.1),
+    OptimizationGoal.BALANCED: (1.0, 1.0, 0.1),
+}
+
+
+@dataclass(slots=True)
 class ShortcutCandidate:
     """A candidate shortcut edge with analysis results."""
 
@@ -113,23 +122,7 @@ class ShortcutOptimizer:
         else:
             self.goal = OptimizationGoal(goal.lower())
 
-        # Adjust weights based on goal
-        if self.goal == OptimizationGoal.LATENCY:
-            self.alpha = 2.0
-            self.beta = 0.5
-            self.gamma = 0.1
-        elif self.goal == OptimizationGoal.PATHS:
-            self.alpha = 2.0
-            self.beta = 0.3
-            self.gamma = 0.0
-        elif self.goal == OptimizationGoal.LOAD:
-            self.alpha = 0.5
-            self.beta = 2.0
-            self.gamma = 0.1
-        else:  # BALANCED
-            self.alpha = 1.0
-            self.beta = 1.0
-            self.gamma = 0.1
+        self.alpha, self.beta, self.gamma = GOAL_WEIGHTS[self.goal]
 
     def find_shortcuts(
         self,
@@ -153,11 +146,16 @@ class ShortcutOptimizer:
 
         # Generate candidate pairs
         candidates = self._generate_candidates(policy)
+        if not candidates:
+            return []
+
+        # Baseline metrics do not depend on the candidate, so compute them once
+        baseline_metrics, _ = MetricsCalculator(graph=self.graph).calculate_all()
 
         # Evaluate each candidate
         evaluated = []
         for source, target in candidates:
-            candidate = self._evaluate_candidate(source, target, policy)
+            candidate = self._evaluate_candidate(source, target, policy, baseline_metrics)
             if candidate and candidate.score > 0:
                 evaluated.append(candidate)
 
@@ -174,6 +172,7 @@ class ShortcutOptimizer:
 
         # Track edges per node for max_new_edges constraint
         edge_counts: dict[str, int] = {n: 0 for n in nodes}
+        forbidden = set(policy.forbidden_pairs)
 
         for source in nodes:
             if edge_counts[source] >= policy.max_new_edges_per_service:
@@ -188,9 +187,7 @@ class ShortcutOptimizer:
                     continue
 
                 # Check forbidden pairs
-                if (source, target) in policy.forbidden_pairs:
-                    continue
-                if (target, source) in policy.forbidden_pairs:
+                if (source, target) in forbidden or (target, source) in forbidden:
                     continue
 
                 # Check zone constraints
@@ -228,11 +225,9 @@ class ShortcutOptimizer:
         source: str,
         target: str,
         policy: PolicyConstraints,
+        baseline_metrics: GraphMetrics,
     ) -> ShortcutCandidate | None:
-        """Evaluate a single shortcut candidate."""
-        # Create baseline metrics calculator
-        baseline_calc = MetricsCalculator(graph=self.graph)
-        baseline_metrics, baseline_node_metrics = baseline_calc.calculate_all()
+        """Evaluate a single shortcut candidate against the unmodified graph's metrics."""
         baseline_obj = self._calculate_objective(baseline_metrics)
 
         # Create modified graph with shortcut
@@ -11,7 +11,9 @@ import json
 from pathlib import Path
 from typing import Any
 
-from smallworld.io.schemas import AnalyzeRequest, ServiceTopology
+from pydantic import ValidationError
+
+from smallworld.io.schemas import ANALYZE_REQUEST_ADAPTER, AnalyzeRequest, ServiceTopology
 
 
 class JsonLoaderError(Exception):
@@ -20,6 +22,23 @@ class JsonLoaderError(Exception):
     pass
 
 
+def loader_error_from_validation(error: ValidationError) -> JsonLoaderError:
+    """
+    Map a pydantic validate_json failure to a JsonLoaderError.
+
+    Args:
+        error: The ValidationError raised while parsing and validating JSON.
+
+    Returns:
+        An "Invalid JSON" error for malformed input, otherwise a validation error.
+    """
+    first = error.errors()[0]
+    # pydantic's json_invalid message already starts with "Invalid JSON: "
+    if first["type"] == "json_invalid":
+        return JsonLoaderError(first["msg"])
+    return JsonLoaderError(f"Validation error: {error}")
+
+
 class JsonLoader:
     """
     Loads and validates service topology from JSON sources.
@@ -49,13 +68,11 @@ class JsonLoader:
 
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise JsonLoaderError(f"Invalid JSON: {e}")
+                json_string = f.read()
         except IOError as e:
             raise JsonLoaderError(f"Cannot read file: {e}")
 
-        return JsonLoader.load_from_dict(data)
+        return JsonLoader.load_from_string(json_string)
 
     @staticmethod
     def load_from_string(json_string: str) -> ServiceTopology:
@@ -71,12 +88,11 @@ class JsonLoader:
         Raises:
             JsonLoaderError: If string cannot be parsed.
         """
+        # Parsed and validated in one pass by pydantic-core
         try:
-            data = json.loads(json_string)
-        except json.JSONDecodeError as e:
-            raise JsonLoaderError(f"Invalid JSON: {e}")
-
-        return JsonLoader.load_from_dict(data)
+            return ServiceTopology.model_validate_json(json_string)
+        except ValidationError as e:
+            raise loader_error_from_validation(e)
 
     @staticmethod
     def load_from_dict(data: dict[str, Any]) -> ServiceTopology:
@@ -118,13 +134,11 @@ class JsonLoader:
 
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise JsonLoaderError(f"Invalid JSON: {e}")
+                json_string = f.read()
         except IOError as e:
             raise JsonLoaderError(f"Cannot read file: {e}")
 
-        return JsonLoader.load_request_from_dict(data)
+        return JsonLoader.load_request_from_string(json_string)
 
     @staticmethod
     def load_request_from_string(json_string: str) -> AnalyzeRequest:
@@ -141,11 +155,9 @@ class JsonLoader:
             JsonLoaderError: If string cannot be parsed.
         """
         try:
-            data = json.loads(json_string)
-        except json.JSONDecodeError as e:
-            raise JsonLoaderError(f"Invalid JSON: {e}")
-
-        return JsonLoader.load_request_from_dict(data)
+            return ANALYZE_REQUEST_ADAPTER.validate_json(json_string)
+        except ValidationError as e:
+            raise loader_error_from_validation(e)
 
     @staticmethod
     def load_request_from_dict(data: dict[str, Any]) -> AnalyzeRequest:
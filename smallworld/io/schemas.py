@@ -9,10 +9,14 @@ Defines the data contracts for:
 
 from __future__ import annotations
 
+import re
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
+
+# Alphanumerics, hyphens, underscores and dots; compiled once for every validated name
+SERVICE_NAME_PATTERN = re.compile(r"[A-Za-z0-9_.-]+")
 
 
 class CriticalityLevel(str, Enum):
@@ -33,13 +37,15 @@ class ServiceData(BaseModel):
 
     name: str = Field(..., min_length=1, max_length=256, description="Unique service name")
     replicas: int = Field(default=1, ge=0, description="Number of service replicas")
-    tags: list[str] = Field(default_factory=list, description="Service tags/labels")
+    tags: tuple[str, ...] = Field(default=(), description="Service tags/labels")
     criticality: CriticalityLevel = Field(
         default=CriticalityLevel.MEDIUM,
         description="Service criticality level"
     )
     zone: str | None = Field(default=None, description="Deployment zone/region")
 
+    model_config = {"frozen": True}
+
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
@@ -47,9 +53,7 @@ class ServiceData(BaseModel):
         v = v.strip()
         if not v:
             raise ValueError("Service name cannot be empty")
-        # Allow alphanumeric, hyphens, underscores
-        allowed = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.")
-        if not all(c in allowed for c in v):
+        if not SERVICE_NAME_PATTERN.fullmatch(v):
             raise ValueError(
                 "Service name can only contain alphanumeric characters, hyphens, underscores, and dots"
             )
@@ -71,7 +75,7 @@ class EdgeData(BaseModel):
     error_rate: float = Field(default=0.0, ge=0, le=1, description="Error rate (0-1)")
     cost: float = Field(default=0.0, ge=0, description="Cost per call")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
 
     @field_validator("source", "target")
     @classmethod
@@ -82,6 +86,13 @@ class EdgeData(BaseModel):
             raise ValueError("Service name cannot be empty")
         return v
 
+    @model_validator(mode="after")
+    def validate_no_self_loop(self) -> EdgeData:
+        """Ensure the edge does not reference its own source."""
+        if self.source == self.target:
+            raise ValueError(f"Self-loop detected: {self.source} -> {self.target}")
+        return self
+
 
 class ServiceTopology(BaseModel):
     """
@@ -99,15 +110,6 @@ class ServiceTopology(BaseModel):
         description="List of service dependencies"
     )
 
-    @field_validator("edges")
-    @classmethod
-    def validate_no_self_loops(cls, edges: list[EdgeData]) -> list[EdgeData]:
-        """Ensure no self-referencing edges."""
-        for edge in edges:
-            if edge.source == edge.target:
-                raise ValueError(f"Self-loop detected: {edge.source} -> {edge.target}")
-        return edges
-
 
 class OptimizationOptions(BaseModel):
     """Options for the optimization analysis."""
@@ -176,6 +178,10 @@ class AnalyzeRequest(BaseModel):
     )
 
 
+# Compiled once so raw JSON requests can be validated without a dict round-trip
+ANALYZE_REQUEST_ADAPTER = TypeAdapter(AnalyzeRequest)
+
+
 class NodeMetricsResponse(BaseModel):
     """Metrics for a single node."""
 
@@ -193,6 +199,8 @@ class NodeMetricsResponse(BaseModel):
     is_bottleneck: bool
     vulnerability_score: float
 
+    model_config = {"frozen": True, "defer_build": True}
+
 
 class GraphMetricsResponse(BaseModel):
     """Global graph metrics."""
@@ -213,6 +221,8 @@ class GraphMetricsResponse(BaseModel):
     bottleneck_count: int
     small_world_coefficient: float
 
+    model_config = {"defer_build": True}
+
 
 class ShortcutSuggestion(BaseModel):
     """A suggested shortcut edge."""
@@ -228,7 +238,7 @@ class ShortcutSuggestion(BaseModel):
     rationale: str
     estimated_latency: float
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True, "defer_build": True}
 
 
 class GraphSummary(BaseModel):
@@ -243,6 +253,8 @@ class GraphSummary(BaseModel):
     is_small_world: bool
     recommendations: list[str]
 
+    model_config = {"defer_build": True}
+
 
 class AnalyzeResponse(BaseModel):
     """
@@ -255,6 +267,8 @@ class AnalyzeResponse(BaseModel):
     graph_summary: GraphSummary
     analysis_metadata: dict[str, Any] = Field(default_factory=dict)
 
+    model_config = {"defer_build": True}
+
 
 class HealthResponse(BaseModel):
     """Health check response."""
@@ -263,6 +277,8 @@ class HealthResponse(BaseModel):
     version: str
     details: dict[str, Any] = Field(default_factory=dict)
 
+    model_config = {"defer_build": True}
+
 
 class ErrorResponse(BaseModel):
     """Error response schema."""
@@ -270,3 +286,5 @@ class ErrorResponse(BaseModel):
     error: str
     detail: str | None = None
     code: str | None = None
+
+    model_config = {"defer_build": True}
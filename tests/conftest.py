@@ -11,12 +11,40 @@ from typing import Any, Generator
 
 import networkx as nx
 import pytest
-
+from fastapi.testclient import TestClient
+from typer.testing import CliRunner
+
+from smallworld.api.app import (
+    app,
+    response_cache,
+    simulation_history,
+    simulation_history_by_user,
+    user_scores,
+)
 from smallworld.core.graph_builder import GraphBuilder
+from smallworld.core.metrics import GraphMetrics, MetricsCalculator, NodeMetrics
+from smallworld.core.shortcut_optimizer import ShortcutCandidate, ShortcutOptimizer
 from smallworld.io.schemas import EdgeData, ServiceData, ServiceTopology
 
 
-@pytest.fixture
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the --runslow flag."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip tests marked slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
 def simple_topology() -> ServiceTopology:
     """Create a simple 3-node topology for testing."""
     return ServiceTopology(
@@ -32,7 +60,7 @@ def simple_topology() -> ServiceTopology:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_topology() -> ServiceTopology:
     """Create a more complex topology with multiple paths."""
     return ServiceTopology(
@@ -57,7 +85,7 @@ def complex_topology() -> ServiceTopology:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def chain_topology() -> ServiceTopology:
     """Create a linear chain topology (worst case for path length)."""
     services = [ServiceData(name=f"service_{i}") for i in range(6)]
@@ -68,7 +96,7 @@ def chain_topology() -> ServiceTopology:
     return ServiceTopology(services=services, edges=edges)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def star_topology() -> ServiceTopology:
     """Create a star topology (hub and spoke)."""
     services = [ServiceData(name="hub")] + [
@@ -81,7 +109,7 @@ def star_topology() -> ServiceTopology:
     return ServiceTopology(services=services, edges=edges)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def disconnected_topology() -> ServiceTopology:
     """Create a topology with disconnected components."""
     return ServiceTopology(
@@ -98,28 +126,63 @@ def disconnected_topology() -> ServiceTopology:
     )
 
 
-@pytest.fixture
+# Graph fixtures are session-scoped and frozen: one build is shared by every
+# metrics and optimizer test, and any accidental mutation fails loudly.
+@pytest.fixture(scope="session")
 def simple_graph(simple_topology: ServiceTopology) -> nx.DiGraph:
     """Create a simple graph from the simple topology."""
     builder = GraphBuilder()
-    return builder.build_from_topology(simple_topology)
+    return nx.freeze(builder.build_from_topology(simple_topology))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_graph(complex_topology: ServiceTopology) -> nx.DiGraph:
     """Create a complex graph from the complex topology."""
     builder = GraphBuilder()
-    return builder.build_from_topology(complex_topology)
+    return nx.freeze(builder.build_from_topology(complex_topology))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def chain_graph(chain_topology: ServiceTopology) -> nx.DiGraph:
     """Create a chain graph from the chain topology."""
     builder = GraphBuilder()
-    return builder.build_from_topology(chain_topology)
+    return nx.freeze(builder.build_from_topology(chain_topology))
+
+
+# Shared read-only input; tests that need a variant must copy it first.
+# calculate_all and find_shortcuts only read the graph, so each fixture graph
+# is analyzed once per session and the tests assert on the shared result.
+@pytest.fixture(scope="session")
+def simple_metrics(simple_graph: nx.DiGraph) -> tuple[GraphMetrics, dict[str, NodeMetrics]]:
+    """Calculate metrics for the simple graph."""
+    return MetricsCalculator(graph=simple_graph).calculate_all()
+
+
+@pytest.fixture(scope="session")
+def complex_metrics(complex_graph: nx.DiGraph) -> tuple[GraphMetrics, dict[str, NodeMetrics]]:
+    """Calculate metrics for the complex graph."""
+    return MetricsCalculator(graph=complex_graph).calculate_all()
+
+
+@pytest.fixture(scope="session")
+def chain_metrics(chain_graph: nx.DiGraph) -> tuple[GraphMetrics, dict[str, NodeMetrics]]:
+    """Calculate metrics for the chain graph."""
+    return MetricsCalculator(graph=chain_graph).calculate_all()
+
+
+@pytest.fixture(scope="session")
+def chain_shortcuts(chain_graph: nx.DiGraph) -> list[ShortcutCandidate]:
+    """Find the top three shortcuts for the chain graph."""
+    return ShortcutOptimizer(graph=chain_graph).find_shortcuts(k=3)
 
 
 @pytest.fixture
+def builder(simple_graph: nx.DiGraph) -> GraphBuilder:
+    """Create a builder holding a mutable copy of the simple graph."""
+    return GraphBuilder(graph=simple_graph.copy())
+
+
+@pytest.fixture(scope="session")
 def sample_topology_dict() -> dict[str, Any]:
     """Return a sample topology as a dictionary."""
     return {
@@ -154,22 +217,55 @@ def sample_json_file(sample_topology_dict: dict[str, Any]) -> Generator[Path, No
         temp_path.unlink()
 
 
+# Shared by every module; tests that need a fresh lifespan or an async client override it
+@pytest.fixture(scope="session")
+def client() -> Generator[TestClient, None, None]:
+    """Create a test client shared by the session."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Create a CLI runner shared by the session."""
+    return CliRunner()
+
+
+# API modules opt in with pytestmark = pytest.mark.usefixtures("reset_api_state")
 @pytest.fixture
-def invalid_json_file() -> Generator[Path, None, None]:
-    """Create a temporary file with invalid JSON."""
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        suffix=".json",
-        delete=False,
+def reset_api_state() -> None:
+    """Clear the in-memory API stores and response cache before a test."""
+    user_scores.clear()
+    simulation_history.clear()
+    simulation_history_by_user.clear()
+    response_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def invalid_json_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a file with invalid JSON, written once per session."""
+    path = tmp_path_factory.mktemp("loader") / "invalid.json"
+    path.write_text("{ invalid json }", encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def single_service_json_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a valid topology file with one service, written once per session."""
+    path = tmp_path_factory.mktemp("loader") / "single_service.json"
+    path.write_text(
+        json.dumps({"services": [{"name": "a", "replicas": 1}], "edges": []}),
         encoding="utf-8",
-    ) as f:
-        f.write("{ invalid json }")
-        temp_path = Path(f.name)
+    )
+    return path
 
-    yield temp_path
 
-    if temp_path.exists():
-        temp_path.unlink()
+@pytest.fixture(scope="session")
+def directory_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a directory to pass where a file path is expected."""
+    path = tmp_path_factory.mktemp("loader") / "is_a_dir"
+    path.mkdir()
+    return path
 
 
 @pytest.fixture
@@ -6,16 +6,11 @@ Achieves 100% coverage for api/app.py
 
 from __future__ import annotations
 
-import pytest
 from fastapi.testclient import TestClient
 
-from smallworld.api.app import app, create_app, generate_recommendations
-
-
-@pytest.fixture
-def client() -> TestClient:
-    """Create test client."""
-    return TestClient(app)
+from smallworld.api.app import create_app, generate_recommendations
+from smallworld.core.metrics import GraphMetrics, NodeMetrics
+from smallworld.core.shortcut_optimizer import ShortcutCandidate
 
 
 class TestRootEndpoint:
@@ -257,8 +252,6 @@ class TestGenerateRecommendations:
 
     def test_poor_small_world(self) -> None:
         """Test recommendation for poor small-world properties."""
-        from smallworld.core.metrics import GraphMetrics, NodeMetrics
-
         graph_metrics = GraphMetrics(
             small_world_coefficient=0.3,
             is_connected=True,
@@ -276,8 +269,6 @@ class TestGenerateRecommendations:
 
     def test_good_small_world(self) -> None:
         """Test recommendation for good small-world properties."""
-        from smallworld.core.metrics import GraphMetrics
-
         graph_metrics = GraphMetrics(
             small_world_coefficient=2.0,
             is_connected=True,
@@ -291,8 +282,6 @@ class TestGenerateRecommendations:
 
     def test_disconnected_warning(self) -> None:
         """Test warning for disconnected graph."""
-        from smallworld.core.metrics import GraphMetrics
-
         graph_metrics = GraphMetrics(
             is_connected=False,
             weakly_connected_components=3,
@@ -307,8 +296,6 @@ class TestGenerateRecommendations:
 
     def test_high_betweenness_warning(self) -> None:
         """Test warning for high betweenness centrality."""
-        from smallworld.core.metrics import GraphMetrics, NodeMetrics
-
         graph_metrics = GraphMetrics(
             max_betweenness=0.6,
             is_connected=True,
@@ -329,8 +316,6 @@ class TestGenerateRecommendations:
 
     def test_high_path_length_warning(self) -> None:
         """Test warning for high average path length."""
-        from smallworld.core.metrics import GraphMetrics
-
         graph_metrics = GraphMetrics(
             average_path_length=5.0,
             is_connected=True,
@@ -344,9 +329,6 @@ class TestGenerateRecommendations:
 
     def test_shortcuts_found(self) -> None:
         """Test recommendation when shortcuts are found."""
-        from smallworld.core.metrics import GraphMetrics
-        from smallworld.core.shortcut_optimizer import ShortcutCandidate
-
         graph_metrics = GraphMetrics(
             is_connected=True,
             small_world_coefficient=1.0,
@@ -364,8 +346,6 @@ class TestGenerateRecommendations:
 
     def test_no_shortcuts_found(self) -> None:
         """Test recommendation when no shortcuts are found."""
-        from smallworld.core.metrics import GraphMetrics
-
         graph_metrics = GraphMetrics(
             is_connected=True,
             small_world_coefficient=1.0,
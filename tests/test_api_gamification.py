@@ -2,53 +2,94 @@
 Tests for API gamification endpoints.
 """
 
+import csv
+import io
+from dataclasses import dataclass, field
+
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+import smallworld.api.app as app_module
+from smallworld.api.app import (
+    SimulationResult,
+    app,
+    response_cache,
+    simulation_history,
+    simulation_history_by_user,
+    user_scores,
+)
+
+
+@dataclass(slots=True)
+class FakeUserScore:
+    """Lightweight stand-in for UserScore inserted directly into the store."""
+
+    user_id: str
+    username: str
+    score: int
+    optimizations: int
+    streak: int
+    achievements: list[str] = field(default_factory=list)
+    last_active: str = "2024-01-01"
+
+
+def add_simulations(user_id: str, count: int) -> None:
+    """Preload simulation history directly, bypassing the HTTP layer."""
+    for i in range(count):
+        result = SimulationResult(
+            id=f"{user_id}-{i}",
+            sequence=next(app_module.simulation_sequence),
+            user_id=user_id,
+            original_path_length=3.0 + i * 0.1,
+            optimized_path_length=2.5 + i * 0.1,
+            improvement_percent=10.0,
+            shortcuts_applied=1,
+            timestamp=f"2024-01-01T00:00:{i:02d}+00:00",
+            points_earned=10,
+        )
+        simulation_history.append(result)
+        simulation_history_by_user[user_id].append(result)
+
 
-from smallworld.api.app import app, user_scores, simulation_history
+pytestmark = pytest.mark.usefixtures("reset_api_state")
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    # Clear state before each test
-    user_scores.clear()
-    simulation_history.clear()
-    return TestClient(app)
+@pytest_asyncio.fixture
+async def client():
+    """Create an async client that calls the app in-process, without a thread portal."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
 
 
 class TestLeaderboard:
     """Tests for leaderboard endpoint."""
 
-    def test_empty_leaderboard(self, client):
+    async def test_empty_leaderboard(self, client):
         """Test leaderboard when empty."""
-        response = client.get("/leaderboard")
+        response = await client.get("/leaderboard")
         assert response.status_code == 200
         assert response.json() == []
 
-    def test_leaderboard_with_users(self, client):
+    async def test_leaderboard_with_users(self, client):
         """Test leaderboard with users."""
         # Add some users
-        user_scores["user1"] = type("UserScore", (), {
-            "user_id": "user1",
-            "username": "alice",
-            "score": 100,
-            "optimizations": 5,
-            "streak": 3,
-            "achievements": [],
-            "last_active": "2024-01-01",
-        })()
-        user_scores["user2"] = type("UserScore", (), {
-            "user_id": "user2",
-            "username": "bob",
-            "score": 200,
-            "optimizations": 10,
-            "streak": 7,
-            "achievements": [],
-            "last_active": "2024-01-01",
-        })()
-
-        response = client.get("/leaderboard")
+        user_scores["user1"] = FakeUserScore(
+            user_id="user1",
+            username="alice",
+            score=100,
+            optimizations=5,
+            streak=3,
+        )
+        user_scores["user2"] = FakeUserScore(
+            user_id="user2",
+            username="bob",
+            score=200,
+            optimizations=10,
+            streak=7,
+        )
+
+        response = await client.get("/leaderboard")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
@@ -58,64 +99,111 @@ class TestLeaderboard:
         assert data[1]["username"] == "alice"
         assert data[1]["rank"] == 2
 
-    def test_leaderboard_limit(self, client):
+    async def test_leaderboard_limit(self, client):
         """Test leaderboard with limit parameter."""
         for i in range(20):
-            user_scores[f"user{i}"] = type("UserScore", (), {
-                "user_id": f"user{i}",
-                "username": f"user_{i}",
-                "score": i * 10,
-                "optimizations": i,
-                "streak": 0,
-                "achievements": [],
-                "last_active": "2024-01-01",
-            })()
-
-        response = client.get("/leaderboard?limit=5")
+            user_scores[f"user{i}"] = FakeUserScore(
+                user_id=f"user{i}",
+                username=f"user_{i}",
+                score=i * 10,
+                optimizations=i,
+                streak=0,
+            )
+
+        response = await client.get("/leaderboard?limit=5")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 5
 
+    async def test_leaderboard_cached_between_reads(self, client):
+        """Test repeated reads are served from the response cache."""
+        await client.get("/users/cached/score")
+        first = (await client.get("/leaderboard")).json()
+
+        # Direct store writes bypass invalidation, so the cached body is reused
+        user_scores["cached"].score = 999
+        assert (await client.get("/leaderboard")).json() == first
+
+    async def test_leaderboard_invalidated_on_score_update(self, client):
+        """Test a score update is visible on the next leaderboard read."""
+        await client.get("/users/riser/score")
+        assert (await client.get("/leaderboard")).json()[0]["score"] == 0
+
+        await client.post("/users/riser/score?points=25")
+        assert (await client.get("/leaderboard")).json()[0]["score"] == 25
+
+    async def test_leaderboard_cache_expires(self, client, monkeypatch):
+        """Test entries older than the TTL are recomputed."""
+        monkeypatch.setattr(app_module, "RESPONSE_CACHE_TTL_SECONDS", 0.0)
+        await client.get("/users/expiring/score")
+        await client.get("/leaderboard")
+
+        user_scores["expiring"].score = 42
+        assert (await client.get("/leaderboard")).json()[0]["score"] == 42
+
+    @pytest.mark.parametrize("limit", [0, app_module.LEADERBOARD_MAX_LIMIT + 1])
+    async def test_leaderboard_limit_bounds(self, client, limit):
+        """Test limits outside 1..LEADERBOARD_MAX_LIMIT are rejected."""
+        response = await client.get(f"/leaderboard?limit={limit}")
+        assert response.status_code == 422
+        assert response_cache == {}
+
+    async def test_leaderboard_cache_evicts_expired(self, client, monkeypatch):
+        """Test storing a new entry drops entries older than the TTL."""
+        monkeypatch.setattr(app_module, "RESPONSE_CACHE_TTL_SECONDS", 0.0)
+        await client.get("/leaderboard?limit=1")
+        await client.get("/leaderboard?limit=2")
+
+        assert list(response_cache) == [("get_leaderboard", ("limit", 2))]
+
+    async def test_leaderboard_cache_stores_body_bytes(self, client):
+        """Test the cache holds rendered bytes and hits replay them unchanged."""
+        first = await client.get("/leaderboard")
+        second = await client.get("/leaderboard")
+
+        (_, body), = response_cache.values()
+        assert body == first.content == second.content
+
 
 class TestUserScore:
     """Tests for user score endpoints."""
 
-    def test_get_new_user_score(self, client):
+    async def test_get_new_user_score(self, client):
         """Test getting score for new user creates user."""
-        response = client.get("/users/newuser123/score")
+        response = await client.get("/users/newuser123/score")
         assert response.status_code == 200
         data = response.json()
         assert data["user_id"] == "newuser123"
         assert data["score"] == 0
         assert data["optimizations"] == 0
 
-    def test_get_existing_user_score(self, client):
+    async def test_get_existing_user_score(self, client):
         """Test getting score for existing user."""
         # Create user first
-        client.get("/users/existinguser/score")
+        await client.get("/users/existinguser/score")
         # Modify the score
         user_scores["existinguser"].score = 500
 
-        response = client.get("/users/existinguser/score")
+        response = await client.get("/users/existinguser/score")
         assert response.status_code == 200
         assert response.json()["score"] == 500
 
-    def test_update_user_score(self, client):
+    async def test_update_user_score(self, client):
         """Test updating user score."""
         # Create user
-        client.get("/users/testuser/score")
+        await client.get("/users/testuser/score")
 
         # Update score
-        response = client.post("/users/testuser/score?points=100")
+        response = await client.post("/users/testuser/score?points=100")
         assert response.status_code == 200
         data = response.json()
         assert data["score"] == 100
 
-    def test_update_score_with_optimization(self, client):
+    async def test_update_score_with_optimization(self, client):
         """Test updating score with optimization completed."""
-        client.get("/users/optimizer/score")
+        await client.get("/users/optimizer/score")
 
-        response = client.post(
+        response = await client.post(
             "/users/optimizer/score?points=50&optimization_completed=true"
         )
         assert response.status_code == 200
@@ -129,9 +217,9 @@ class TestUserScore:
 class TestAchievements:
     """Tests for achievements endpoint."""
 
-    def test_get_achievements(self, client):
+    async def test_get_achievements(self, client):
         """Test getting all achievements."""
-        response = client.get("/achievements")
+        response = await client.get("/achievements")
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 5
@@ -147,9 +235,9 @@ class TestAchievements:
 class TestSimulations:
     """Tests for simulation endpoints."""
 
-    def test_record_simulation(self, client):
+    async def test_record_simulation(self, client):
         """Test recording a simulation result."""
-        response = client.post(
+        response = await client.post(
             "/simulations?user_id=simuser&original_path_length=3.0"
             "&optimized_path_length=2.5&shortcuts_applied=2"
         )
@@ -161,9 +249,9 @@ class TestSimulations:
         assert data["improvement_percent"] > 0
         assert data["points_earned"] > 0
 
-    def test_simulation_with_high_improvement(self, client):
+    async def test_simulation_with_high_improvement(self, client):
         """Test simulation with 50%+ improvement for achievement."""
-        response = client.post(
+        response = await client.post(
             "/simulations?user_id=perfectuser&original_path_length=4.0"
             "&optimized_path_length=1.5&shortcuts_applied=3"
         )
@@ -172,69 +260,109 @@ class TestSimulations:
         assert data["improvement_percent"] >= 50
 
         # Check user got the perfect_score achievement
-        user_response = client.get("/users/perfectuser/score")
+        user_response = await client.get("/users/perfectuser/score")
         user_data = user_response.json()
         assert "perfect_score" in user_data["achievements"]
 
-    def test_get_simulation_history(self, client):
+    async def test_get_simulation_history(self, client):
         """Test getting simulation history."""
         # Record some simulations
-        client.post(
+        await client.post(
             "/simulations?user_id=histuser&original_path_length=3.0"
             "&optimized_path_length=2.5&shortcuts_applied=1"
         )
-        client.post(
+        await client.post(
             "/simulations?user_id=histuser&original_path_length=3.0"
             "&optimized_path_length=2.0&shortcuts_applied=2"
         )
 
-        response = client.get("/simulations?user_id=histuser")
+        response = await client.get("/simulations?user_id=histuser")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
 
-    def test_get_all_simulations(self, client):
+    async def test_get_all_simulations(self, client):
         """Test getting all simulations without user filter."""
-        client.post(
+        await client.post(
             "/simulations?user_id=user1&original_path_length=3.0"
             "&optimized_path_length=2.5&shortcuts_applied=1"
         )
-        client.post(
+        await client.post(
             "/simulations?user_id=user2&original_path_length=3.0"
             "&optimized_path_length=2.0&shortcuts_applied=2"
         )
 
-        response = client.get("/simulations")
+        response = await client.get("/simulations")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
 
-    def test_simulation_history_limit(self, client):
+    async def test_simulation_history_limit(self, client):
         """Test simulation history with limit."""
-        for i in range(10):
-            client.post(
-                f"/simulations?user_id=limituser&original_path_length={3.0 + i * 0.1}"
-                f"&optimized_path_length={2.5 + i * 0.1}&shortcuts_applied=1"
-            )
+        add_simulations("limituser", 10)
 
-        response = client.get("/simulations?user_id=limituser&limit=5")
+        response = await client.get("/simulations?user_id=limituser&limit=5")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 5
 
+    async def test_simulation_history_cursor(self, client):
+        """Test paging through history with the next-cursor header."""
+        add_simulations("pager", 5)
+
+        first = await client.get("/simulations?user_id=pager&limit=2")
+        cursor = first.headers["X-Next-Cursor"]
+        second = await client.get(f"/simulations?user_id=pager&limit=2&cursor={cursor}")
+        last = await client.get(
+            f"/simulations?user_id=pager&limit=2&cursor={second.headers['X-Next-Cursor']}"
+        )
+
+        pages = [first.json(), second.json(), last.json()]
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [r["id"] for page in pages for r in page] == [f"pager-{i}" for i in range(4, -1, -1)]
+        assert "X-Next-Cursor" not in last.headers
+
+    async def test_simulation_history_hides_sequence(self, client):
+        """Test the internal ordering key is not part of the public payload."""
+        add_simulations("private", 1)
+
+        response = await client.get("/simulations?user_id=private")
+        assert "sequence" not in response.json()[0]
+
+    async def test_next_cursor_exposed_to_browsers(self, client):
+        """Test CORS lets cross-origin scripts read the cursor header."""
+        add_simulations("browser", 3)
+
+        response = await client.get(
+            "/simulations?user_id=browser&limit=1", headers={"Origin": "http://example.com"}
+        )
+        assert "X-Next-Cursor" in response.headers["access-control-expose-headers"]
+
+    async def test_simulation_history_unknown_user(self, client):
+        """Test history for a user with no simulations is empty."""
+        await client.post(
+            "/simulations?user_id=someone&original_path_length=3.0"
+            "&optimized_path_length=2.5&shortcuts_applied=1"
+        )
+
+        response = await client.get("/simulations?user_id=nobody")
+        assert response.status_code == 200
+        assert response.json() == []
+        assert "nobody" not in simulation_history_by_user
+
 
 class TestExport:
     """Tests for export endpoint."""
 
-    def test_export_json(self, client):
+    async def test_export_json(self, client):
         """Test exporting data as JSON."""
         # Add some data first
-        client.post(
+        await client.post(
             "/simulations?user_id=exportuser&original_path_length=3.0"
             "&optimized_path_length=2.5&shortcuts_applied=1"
         )
 
-        response = client.get("/export/json")
+        response = await client.get("/export/json")
         assert response.status_code == 200
         data = response.json()
         assert "export_date" in data
@@ -242,37 +370,59 @@ class TestExport:
         assert "simulations" in data
         assert data["total_simulations"] >= 1
 
-    def test_export_csv(self, client):
+    async def test_export_csv(self, client):
         """Test exporting data as CSV."""
-        client.post(
+        await client.post(
             "/simulations?user_id=csvuser&original_path_length=3.0"
             "&optimized_path_length=2.5&shortcuts_applied=1"
         )
 
-        response = client.get("/export/csv")
+        response = await client.get("/export/csv")
         assert response.status_code == 200
         data = response.json()
         assert "csv" in data
         assert "id,user_id" in data["csv"]
 
-    def test_export_user_filter(self, client):
+    async def test_export_csv_exact_body(self, client):
+        """Test the CSV body is newline-joined rows without a trailing newline."""
+        add_simulations("exact", 1)
+
+        csv_text = (await client.get("/export/csv")).json()["csv"]
+        assert csv_text == (
+            "id,user_id,original_path_length,optimized_path_length,improvement_percent,"
+            "shortcuts_applied,timestamp,points_earned\n"
+            "exact-0,exact,3.0,2.5,10.0,1,2024-01-01T00:00:00+00:00,10"
+        )
+
+    async def test_export_csv_quotes_commas(self, client):
+        """Test user ids containing commas are quoted in CSV output."""
+        await client.post(
+            "/simulations?user_id=doe,jane&original_path_length=3.0"
+            "&optimized_path_length=2.5&shortcuts_applied=1"
+        )
+
+        csv_text = (await client.get("/export/csv")).json()["csv"]
+        row = next(csv.reader(io.StringIO(csv_text.splitlines()[1])))
+        assert row[1] == "doe,jane"
+
+    async def test_export_user_filter(self, client):
         """Test export with user filter."""
-        client.post(
+        await client.post(
             "/simulations?user_id=userA&original_path_length=3.0"
             "&optimized_path_length=2.5&shortcuts_applied=1"
         )
-        client.post(
+        await client.post(
             "/simulations?user_id=userB&original_path_length=3.0"
             "&optimized_path_length=2.0&shortcuts_applied=2"
         )
 
-        response = client.get("/export/json?user_id=userA")
+        response = await client.get("/export/json?user_id=userA")
         assert response.status_code == 200
         data = response.json()
         assert data["total_simulations"] == 1
 
-    def test_export_invalid_format(self, client):
+    async def test_export_invalid_format(self, client):
         """Test export with invalid format."""
-        response = client.get("/export/xml")
+        response = await client.get("/export/xml")
         assert response.status_code == 400
         assert "Unsupported format" in response.json()["error"]
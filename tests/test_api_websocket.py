@@ -8,10 +8,11 @@ from fastapi.testclient import TestClient
 from smallworld.api.app import app, manager
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def client():
-    """Create test client."""
-    return TestClient(app)
+    """Create a test client shared by the tests of one class."""
+    with TestClient(app) as c:
+        yield c
 
 
 class TestWebSocket:
@@ -53,7 +54,6 @@ class TestConnectionManager:
         assert hasattr(manager, "disconnect")
         assert hasattr(manager, "broadcast")
 
-    @pytest.mark.asyncio
     async def test_broadcast_empty(self):
         """Test broadcast with no connections."""
         # Should not raise
@@ -7,38 +7,26 @@ Achieves 100% coverage for cli.py
 from __future__ import annotations
 
 import json
-import tempfile
+import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 from typer.testing import CliRunner
 
-from smallworld.cli import app
+from smallworld.cli import app, load_topology
+from smallworld.io.json_loader import JsonLoaderError
 
 
-@pytest.fixture
-def runner() -> CliRunner:
-    """Create CLI test runner."""
-    return CliRunner()
-
-
-@pytest.fixture
-def sample_topology_file(sample_topology_dict: dict) -> Path:
+# The topology file is read-only, so one serves the module.
+@pytest.fixture(scope="module")
+def sample_topology_file(
+    sample_topology_dict: dict, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
     """Create a temporary topology file."""
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        suffix=".json",
-        delete=False,
-        encoding="utf-8",
-    ) as f:
-        json.dump(sample_topology_dict, f)
-        temp_path = Path(f.name)
-
-    yield temp_path
-
-    if temp_path.exists():
-        temp_path.unlink()
+    temp_path = tmp_path_factory.mktemp("cli") / "topology.json"
+    temp_path.write_text(json.dumps(sample_topology_dict), encoding="utf-8")
+    return temp_path
 
 
 class TestVersion:
@@ -231,9 +219,64 @@ class TestValidateCommand:
         assert "undefined services" in result.output
 
 
+class TestLoadTopology:
+    """Tests for the cached topology loader."""
+
+    def test_reuses_parse_for_unchanged_file(self, sample_topology_file: Path) -> None:
+        """Test repeated loads of an unchanged file share one parse."""
+        first = load_topology(sample_topology_file)
+        second = load_topology(sample_topology_file)
+
+        assert first.services[0] is second.services[0]
+
+    def test_callers_do_not_share_mutations(self, sample_topology_file: Path) -> None:
+        """Test changes to one loaded topology do not reach later loads."""
+        first = load_topology(sample_topology_file)
+        first.services.clear()
+
+        assert len(load_topology(sample_topology_file).services) == 3
+
+    def test_reloads_same_mtime_rewrite_of_new_size(self, tmp_path: Path) -> None:
+        """Test a rewrite within the same mtime tick is parsed again if its size changed."""
+        file_path = tmp_path / "topology.json"
+        file_path.write_text(json.dumps({"services": [{"name": "a"}], "edges": []}))
+        stat = file_path.stat()
+        load_topology(file_path)
+
+        file_path.write_text(json.dumps({"services": [{"name": "bb"}], "edges": []}))
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_topology(file_path).services[0].name == "bb"
+
+    def test_reloads_rewritten_file(self, tmp_path: Path) -> None:
+        """Test a rewrite with a new mtime is parsed again."""
+        file_path = tmp_path / "topology.json"
+        file_path.write_text(json.dumps({"services": [{"name": "a"}], "edges": []}))
+        first = load_topology(file_path)
+
+        file_path.write_text(json.dumps({"services": [{"name": "b"}], "edges": []}))
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert first.services[0].name == "a"
+        assert load_topology(file_path).services[0].name == "b"
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test a missing file raises the loader error."""
+        with pytest.raises(JsonLoaderError, match="File not found"):
+            load_topology(tmp_path / "missing.json")
+
+
 class TestServeCommand:
     """Tests for serve command."""
 
+    @pytest.fixture(autouse=True)
+    def mock_uvicorn(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Replace uvicorn.run so no server is started."""
+        mock = MagicMock()
+        monkeypatch.setattr("uvicorn.run", mock)
+        return mock
+
     def test_serve_help(self, runner: CliRunner) -> None:
         """Test serve command help."""
         result = runner.invoke(app, ["serve", "--help"])
@@ -242,9 +285,8 @@ class TestServeCommand:
         assert "host" in result.output
         assert "port" in result.output
 
-    @patch("uvicorn.run")
     def test_serve_default(
-        self, mock_uvicorn: any, runner: CliRunner
+        self, mock_uvicorn: MagicMock, runner: CliRunner
     ) -> None:
         """Test serve with default options."""
         result = runner.invoke(app, ["serve"])
@@ -258,9 +300,8 @@ class TestServeCommand:
         assert call_kwargs["port"] == 8000
         assert call_kwargs["reload"] is False
 
-    @patch("uvicorn.run")
     def test_serve_custom_port(
-        self, mock_uvicorn: any, runner: CliRunner
+        self, mock_uvicorn: MagicMock, runner: CliRunner
     ) -> None:
         """Test serve with custom port."""
         result = runner.invoke(app, ["serve", "--port", "8080"])
@@ -269,9 +310,8 @@ class TestServeCommand:
         call_kwargs = mock_uvicorn.call_args[1]
         assert call_kwargs["port"] == 8080
 
-    @patch("uvicorn.run")
     def test_serve_custom_host(
-        self, mock_uvicorn: any, runner: CliRunner
+        self, mock_uvicorn: MagicMock, runner: CliRunner
     ) -> None:
         """Test serve with custom host."""
         result = runner.invoke(app, ["serve", "--host", "127.0.0.1"])
@@ -280,9 +320,8 @@ class TestServeCommand:
         call_kwargs = mock_uvicorn.call_args[1]
         assert call_kwargs["host"] == "127.0.0.1"
 
-    @patch("uvicorn.run")
     def test_serve_with_reload(
-        self, mock_uvicorn: any, runner: CliRunner
+        self, mock_uvicorn: MagicMock, runner: CliRunner
     ) -> None:
         """Test serve with reload enabled."""
         result = runner.invoke(app, ["serve", "--reload"])
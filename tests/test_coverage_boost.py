@@ -3,20 +3,15 @@ Additional tests to boost code coverage.
 """
 
 import pytest
-from fastapi.testclient import TestClient
 
-from smallworld.api.app import app, manager, user_scores, simulation_history
+from smallworld.api.app import manager
 from smallworld.core.graph_builder import GraphBuilder
 from smallworld.core.metrics import MetricsCalculator
 from smallworld.core.shortcut_optimizer import ShortcutOptimizer
+from smallworld.io.json_loader import JsonLoader
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    user_scores.clear()
-    simulation_history.clear()
-    return TestClient(app)
+pytestmark = pytest.mark.usefixtures("reset_api_state")
 
 
 class TestMetricsCoverage:
@@ -242,8 +237,6 @@ class TestJsonLoaderCoverage:
 
     def test_loader_with_request_options(self):
         """Test loading analyze request with all options."""
-        from smallworld.io.json_loader import JsonLoader
-
         data = {
             "services": [
                 {"name": "a", "replicas": 1, "criticality": "medium"},
@@ -10,6 +10,8 @@ from unittest.mock import patch, MagicMock
 import pytest
 import networkx as nx
 
+import smallworld.cli as cli
+from smallworld.cli import app as cli_app, print_top_nodes
 from smallworld.core.metrics import MetricsCalculator, GraphMetrics
 from smallworld.core.shortcut_optimizer import ShortcutOptimizer, OptimizationGoal
 
@@ -17,29 +19,15 @@ from smallworld.core.shortcut_optimizer import ShortcutOptimizer, OptimizationGo
 class TestCLIUvicornImportError:
     """Test CLI serve command when uvicorn is not installed."""
 
-    def test_serve_without_uvicorn(self):
+    def test_serve_without_uvicorn(self, runner):
         """Test serve command handles missing uvicorn gracefully."""
-        from typer.testing import CliRunner
-        from smallworld.cli import app as cli_app
-
-        runner = CliRunner()
-
-        # Mock uvicorn import to raise ImportError
+        # A None entry in sys.modules makes `import uvicorn` raise ImportError
         with patch.dict(sys.modules, {'uvicorn': None}):
-            # We need to force the import to fail
-            import builtins
-            original_import = builtins.__import__
+            result = runner.invoke(cli_app, ["serve"])
 
-            def mock_import(name, *args, **kwargs):
-                if name == 'uvicorn':
-                    raise ImportError("No module named 'uvicorn'")
-                return original_import(name, *args, **kwargs)
-
-            with patch.object(builtins, '__import__', mock_import):
-                result = runner.invoke(cli_app, ["serve"])
-                # Command should exit with error code 1
-                assert result.exit_code == 1
-                assert "uvicorn not installed" in result.output
+        # Command should exit with error code 1
+        assert result.exit_code == 1
+        assert "uvicorn not installed" in result.output
 
 
 class TestCLIPrintTopNodesEmpty:
@@ -47,8 +35,6 @@ class TestCLIPrintTopNodesEmpty:
 
     def test_print_top_nodes_empty_dict(self):
         """Test print_top_nodes returns early for empty dict."""
-        from smallworld.cli import print_top_nodes
-
         # Should not raise, just return early
         result = print_top_nodes({})
         assert result is None
@@ -57,35 +43,27 @@ class TestCLIPrintTopNodesEmpty:
 class TestCLIMainBlock:
     """Test CLI main block execution."""
 
-    def test_main_block_execution(self):
+    def test_main_block_execution(self, runner):
         """Test that main block can be executed."""
-        # We can test this by importing and running app()
-        from smallworld.cli import app
-        from typer.testing import CliRunner
-
-        runner = CliRunner()
         # Run --help to verify app works
-        result = runner.invoke(app, ["--help"])
+        result = runner.invoke(cli_app, ["--help"])
         assert result.exit_code == 0
 
-    def test_main_block_via_runpy(self):
-        """Test main block via runpy to cover if __name__ == '__main__'."""
-        import runpy
-        import sys
+    def test_main_block(self, monkeypatch):
+        """Test the if __name__ == '__main__' block calls app()."""
+        # Execute only the trailing block, compiled at its real line numbers so
+        # coverage attributes it to cli.py, against the already-imported module.
+        source = Path(cli.__file__).read_text(encoding="utf-8")
+        main_block = source[source.index('if __name__ == "__main__":'):]
+        offset = source.count("\n", 0, len(source) - len(main_block))
+        code = compile("\n" * offset + main_block, cli.__file__, "exec")
 
-        # Save original argv and set to show help
-        original_argv = sys.argv
-        sys.argv = ["smallworld", "--help"]
+        monkeypatch.setattr(sys, "argv", ["smallworld", "--help"])
+        with pytest.raises(SystemExit) as exc_info:
+            exec(code, {**vars(cli), "__name__": "__main__"})
 
-        try:
-            # This should execute the main block and call app()
-            # We catch SystemExit since --help causes exit
-            with pytest.raises(SystemExit) as exc_info:
-                runpy.run_module("smallworld.cli", run_name="__main__", alter_sys=True)
-            # --help exits with code 0
-            assert exc_info.value.code == 0
-        finally:
-            sys.argv = original_argv
+        # --help exits with code 0
+        assert exc_info.value.code == 0
 
 
 class TestMetricsGraphMetricsEmpty:
@@ -110,8 +88,7 @@ class TestMetricsNetworkXNoPath:
     def test_weighted_path_length_no_path(self):
         """Test weighted path length handles NetworkXNoPath exception."""
         graph = nx.DiGraph()
-        graph.add_node("a")
-        graph.add_node("b")
+        graph.add_nodes_from(["a", "b"])
         # No edge between a and b - no path exists
 
         calc = MetricsCalculator(graph)
@@ -144,8 +121,7 @@ class TestMetricsSmallWorldEdgeCases:
         """Test small world coefficient when random_clustering is 0."""
         graph = nx.DiGraph()
         # Create graph with 0 edges - p will be 0, so random_clustering = 0
-        for i in range(5):
-            graph.add_node(f"n{i}")
+        graph.add_nodes_from(f"n{i}" for i in range(5))
 
         calc = MetricsCalculator(graph)
         graph_metrics, _ = calc.calculate_all()
@@ -176,8 +152,7 @@ class TestMetricsSmallWorldEdgeCases:
         """Test small world coefficient when random_path_length becomes 0."""
         graph = nx.DiGraph()
         # This tests line 368-369: when random_clustering or random_path_length is 0
-        for i in range(3):
-            graph.add_node(f"n{i}")
+        graph.add_nodes_from(f"n{i}" for i in range(3))
 
         calc = MetricsCalculator(graph)
         # Call with values that would make random_clustering = 0
@@ -225,56 +200,35 @@ class TestMetricsIdentifyHubsBottlenecksEmpty:
         assert graph_metrics.bottleneck_count == 0
 
 
-class TestOptimizerGoalEnumDirect:
-    """Test optimizer set_goal with OptimizationGoal enum directly."""
-
-    def test_set_goal_with_enum_latency(self):
-        """Test setting goal with OptimizationGoal.LATENCY enum."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
-
-        optimizer = ShortcutOptimizer(graph)
-        optimizer.set_goal(OptimizationGoal.LATENCY)
-
-        assert optimizer.goal == OptimizationGoal.LATENCY
-        assert optimizer.alpha == 2.0
-        assert optimizer.beta == 0.5
-
-    def test_set_goal_with_enum_paths(self):
-        """Test setting goal with OptimizationGoal.PATHS enum."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
-
-        optimizer = ShortcutOptimizer(graph)
-        optimizer.set_goal(OptimizationGoal.PATHS)
-
-        assert optimizer.goal == OptimizationGoal.PATHS
-        assert optimizer.alpha == 2.0
-        assert optimizer.beta == 0.3
-
-    def test_set_goal_with_enum_load(self):
-        """Test setting goal with OptimizationGoal.LOAD enum."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
-
-        optimizer = ShortcutOptimizer(graph)
-        optimizer.set_goal(OptimizationGoal.LOAD)
-
-        assert optimizer.goal == OptimizationGoal.LOAD
-        assert optimizer.alpha == 0.5
-        assert optimizer.beta == 2.0
+@pytest.fixture(scope="module")
+def two_node_graph():
+    """Create a frozen a -> b graph shared by the goal tests."""
+    graph = nx.DiGraph()
+    graph.add_edge("a", "b")
+    return nx.freeze(graph)
 
-    def test_set_goal_with_enum_balanced(self):
-        """Test setting goal with OptimizationGoal.BALANCED enum."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
 
-        optimizer = ShortcutOptimizer(graph)
-        optimizer.set_goal(OptimizationGoal.BALANCED)
+class TestOptimizerGoalEnumDirect:
+    """Test optimizer set_goal with OptimizationGoal enum directly."""
 
-        assert optimizer.goal == OptimizationGoal.BALANCED
-        assert optimizer.alpha == 1.0
-        assert optimizer.beta == 1.0
+    @pytest.mark.parametrize(
+        "goal, alpha, beta, gamma",
+        [
+            (OptimizationGoal.LATENCY, 2.0, 0.5, 0.1),
+            (OptimizationGoal.PATHS, 2.0, 0.3, 0.0),
+            (OptimizationGoal.LOAD, 0.5, 2.0, 0.1),
+            (OptimizationGoal.BALANCED, 1.0, 1.0, 0.1),
+        ],
+    )
+    def test_set_goal_with_enum(self, two_node_graph, goal, alpha, beta, gamma):
+        """Test setting each goal with the OptimizationGoal enum."""
+        optimizer = ShortcutOptimizer(two_node_graph)
+        optimizer.set_goal(goal)
+
+        assert optimizer.goal == goal
+        assert optimizer.alpha == alpha
+        assert optimizer.beta == beta
+        assert optimizer.gamma == gamma
 
 
 class TestMetricsWeightedPathNetworkXNoPathSpecific:
@@ -296,29 +250,16 @@ class TestMetricsWeightedPathNetworkXNoPathSpecific:
         # Should return a valid value (path length for a->b)
         assert result >= 0.0
 
-    def test_networkx_no_path_exception_mocked(self):
-        """Test NetworkXNoPath exception handling with mock."""
+    def test_unreachable_pairs_skipped(self):
+        """Test only reachable ordered pairs contribute to the average."""
         graph = nx.DiGraph()
-        graph.add_edge("a", "b", weight=1.0)
-        graph.add_edge("b", "c", weight=2.0)
+        graph.add_edges_from([("a", "b", {"weight": 1.0}), ("b", "c", {"weight": 2.0})])
 
         calc = MetricsCalculator(graph)
+        result = calc._calculate_weighted_average_path_length()
 
-        # Mock single_source_dijkstra_path_length to raise NetworkXNoPath
-        call_count = [0]
-        original_dijkstra = nx.single_source_dijkstra_path_length
-
-        def mock_dijkstra(G, source, *args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 2:  # Raise on second call
-                raise nx.NetworkXNoPath("No path")
-            return original_dijkstra(G, source, *args, **kwargs)
-
-        with patch.object(nx, 'single_source_dijkstra_path_length', side_effect=mock_dijkstra):
-            result = calc._calculate_weighted_average_path_length()
-
-        # Should handle the exception gracefully
-        assert result >= 0.0
+        # a->b = 1, b->c = 2, a->c = 3; nothing reaches back
+        assert result == pytest.approx(2.0)
 
 
 class TestMetricsSmallWorldWithSpecificValues:
@@ -357,8 +298,7 @@ class TestMetricsSmallWorldWithSpecificValues:
         """Test small world when average degree < 1 (uses fallback path length)."""
         graph = nx.DiGraph()
         # Many nodes, few edges
-        for i in range(10):
-            graph.add_node(f"n{i}")
+        graph.add_nodes_from(f"n{i}" for i in range(10))
 
         calc = MetricsCalculator(graph)
         # m=0 means avg_degree = 0, which triggers fallback
@@ -80,54 +80,31 @@ class TestGraphBuilder:
         assert builder.has_node("b")
         assert builder.has_edge("a", "b")
 
-    def test_get_undirected_view(self, simple_topology: ServiceTopology) -> None:
+    def test_get_undirected_view(self, builder: GraphBuilder) -> None:
         """Test getting undirected view of graph."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
         undirected = builder.get_undirected_view()
 
         assert isinstance(undirected, nx.Graph)
         assert not isinstance(undirected, nx.DiGraph)
         assert undirected.number_of_nodes() == 3
 
-    def test_get_neighbors(self, simple_topology: ServiceTopology) -> None:
-        """Test getting successors of a node."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
-        neighbors = builder.get_neighbors("gateway")
-        assert "auth" in neighbors
-        assert len(neighbors) == 1
-
-    def test_get_neighbors_nonexistent_node(self, simple_topology: ServiceTopology) -> None:
-        """Test getting neighbors of nonexistent node."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
-        neighbors = builder.get_neighbors("nonexistent")
-        assert neighbors == []
-
-    def test_get_predecessors(self, simple_topology: ServiceTopology) -> None:
-        """Test getting predecessors of a node."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
-        predecessors = builder.get_predecessors("auth")
-        assert "gateway" in predecessors
-
-    def test_get_predecessors_nonexistent_node(self, simple_topology: ServiceTopology) -> None:
-        """Test getting predecessors of nonexistent node."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
-        predecessors = builder.get_predecessors("nonexistent")
-        assert predecessors == []
-
-    def test_add_shortcut_edge(self, simple_topology: ServiceTopology) -> None:
+    @pytest.mark.parametrize(
+        ("method", "node", "expected"),
+        [
+            ("get_neighbors", "gateway", ["auth"]),
+            ("get_neighbors", "nonexistent", []),
+            ("get_predecessors", "auth", ["gateway"]),
+            ("get_predecessors", "nonexistent", []),
+        ],
+    )
+    def test_adjacency(
+        self, builder: GraphBuilder, method: str, node: str, expected: list[str]
+    ) -> None:
+        """Test successor/predecessor lookups, including unknown nodes."""
+        assert getattr(builder, method)(node) == expected
+
+    def test_add_shortcut_edge(self, builder: GraphBuilder) -> None:
         """Test adding a shortcut edge."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
         result = builder.add_shortcut_edge(
             "gateway", "users",
             call_rate=50.0,
@@ -138,38 +115,26 @@ class TestGraphBuilder:
         assert builder.has_edge("gateway", "users")
         assert builder.graph.edges["gateway", "users"]["is_shortcut"] is True
 
-    def test_add_shortcut_edge_already_exists(self, simple_topology: ServiceTopology) -> None:
+    def test_add_shortcut_edge_already_exists(self, builder: GraphBuilder) -> None:
         """Test adding a shortcut edge that already exists."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
         result = builder.add_shortcut_edge("gateway", "auth")
         assert result is False  # Edge already exists
 
-    def test_remove_edge(self, simple_topology: ServiceTopology) -> None:
+    def test_remove_edge(self, builder: GraphBuilder) -> None:
         """Test removing an edge."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
         assert builder.has_edge("gateway", "auth")
         result = builder.remove_edge("gateway", "auth")
 
         assert result is True
         assert not builder.has_edge("gateway", "auth")
 
-    def test_remove_edge_nonexistent(self, simple_topology: ServiceTopology) -> None:
+    def test_remove_edge_nonexistent(self, builder: GraphBuilder) -> None:
         """Test removing an edge that doesn't exist."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
         result = builder.remove_edge("gateway", "users")
         assert result is False
 
-    def test_copy(self, simple_topology: ServiceTopology) -> None:
+    def test_copy(self, builder: GraphBuilder) -> None:
         """Test copying the graph builder."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
         copy = builder.copy()
 
         # Verify copy is independent
@@ -177,11 +142,8 @@ class TestGraphBuilder:
         copy.remove_edge("gateway", "auth")
         assert builder.has_edge("gateway", "auth")  # Original unchanged
 
-    def test_to_dict(self, simple_topology: ServiceTopology) -> None:
+    def test_to_dict(self, builder: GraphBuilder) -> None:
         """Test exporting graph to dictionary."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
         result = builder.to_dict()
 
         assert "services" in result
@@ -189,11 +151,8 @@ class TestGraphBuilder:
         assert len(result["services"]) == 3
         assert len(result["edges"]) == 2
 
-    def test_to_dict_preserves_data(self, simple_topology: ServiceTopology) -> None:
+    def test_to_dict_preserves_data(self, builder: GraphBuilder) -> None:
         """Test that to_dict preserves node and edge data."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
         result = builder.to_dict()
 
         # Find gateway in services
@@ -225,33 +184,24 @@ class TestGraphBuilder:
         # Weight should default to 1.0 when p50_latency is 0
         assert graph.edges["a", "b"]["weight"] == 1.0
 
-    def test_has_node_true(self, simple_topology: ServiceTopology) -> None:
-        """Test has_node returns True for existing node."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-        assert builder.has_node("gateway") is True
-
-    def test_has_node_false(self, simple_topology: ServiceTopology) -> None:
-        """Test has_node returns False for non-existing node."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-        assert builder.has_node("nonexistent") is False
-
-    def test_has_edge_true(self, simple_topology: ServiceTopology) -> None:
-        """Test has_edge returns True for existing edge."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-        assert builder.has_edge("gateway", "auth") is True
-
-    def test_has_edge_false(self, simple_topology: ServiceTopology) -> None:
-        """Test has_edge returns False for non-existing edge."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-        assert builder.has_edge("gateway", "users") is False
+    @pytest.mark.parametrize(("node", "expected"), [("gateway", True), ("nonexistent", False)])
+    def test_has_node(self, builder: GraphBuilder, node: str, expected: bool) -> None:
+        """Test has_node for existing and missing nodes."""
+        assert builder.has_node(node) is expected
+
+    @pytest.mark.parametrize(
+        ("source", "target", "expected"),
+        [("gateway", "auth", True), ("gateway", "users", False)],
+    )
+    def test_has_edge(
+        self, builder: GraphBuilder, source: str, target: str, expected: bool
+    ) -> None:
+        """Test has_edge for existing and missing edges."""
+        assert builder.has_edge(source, target) is expected
 
     def test_empty_topology(self) -> None:
         """Test handling empty topology."""
-        topology = ServiceTopology(services=[], edges=[])
+        topology = ServiceTopology.model_construct(services=[], edges=[])
         builder = GraphBuilder()
         graph = builder.build_from_topology(topology)
 
@@ -276,11 +226,8 @@ class TestGraphBuilder:
         assert graph.nodes["svc1"]["zone"] == "us-east-1"
         assert graph.nodes["svc2"]["zone"] == "us-west-2"
 
-    def test_add_shortcut_with_defaults(self, simple_topology: ServiceTopology) -> None:
+    def test_add_shortcut_with_defaults(self, builder: GraphBuilder) -> None:
         """Test adding shortcut with default values."""
-        builder = GraphBuilder()
-        builder.build_from_topology(simple_topology)
-
         builder.add_shortcut_edge("gateway", "users")
         edge = builder.graph.edges["gateway", "users"]
 
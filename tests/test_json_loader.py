@@ -7,7 +7,6 @@ Achieves 100% coverage for json_loader.py
 from __future__ import annotations
 
 import json
-import tempfile
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +15,9 @@ import pytest
 from smallworld.io.json_loader import JsonLoader, JsonLoaderError
 from smallworld.io.schemas import ServiceData, ServiceTopology
 
+# Serialized by the save and to_json_string tests, which only read it
+SINGLE_SERVICE_TOPOLOGY = ServiceTopology(services=[ServiceData(name="test")], edges=[])
+
 
 class TestJsonLoader:
     """Tests for JsonLoader class."""
@@ -30,25 +32,19 @@ class TestJsonLoader:
     def test_load_from_file_not_found(self, tmp_path: Path) -> None:
         """Test loading non-existent file."""
         nonexistent_path = tmp_path / "does_not_exist" / "file.json"
-        with pytest.raises(JsonLoaderError) as exc_info:
+        with pytest.raises(JsonLoaderError, match="File not found"):
             JsonLoader.load_from_file(nonexistent_path)
 
-        assert "File not found" in str(exc_info.value)
-
     def test_load_from_file_not_a_file(self, tmp_path: Path) -> None:
         """Test loading a directory instead of file."""
-        with pytest.raises(JsonLoaderError) as exc_info:
+        with pytest.raises(JsonLoaderError, match="Not a file"):
             JsonLoader.load_from_file(tmp_path)
 
-        assert "Not a file" in str(exc_info.value)
-
     def test_load_from_file_invalid_json(self, invalid_json_file: Path) -> None:
         """Test loading invalid JSON file."""
-        with pytest.raises(JsonLoaderError) as exc_info:
+        with pytest.raises(JsonLoaderError, match="Invalid JSON"):
             JsonLoader.load_from_file(invalid_json_file)
 
-        assert "Invalid JSON" in str(exc_info.value)
-
     def test_load_from_string_success(self) -> None:
         """Test loading valid JSON string."""
         json_string = json.dumps({
@@ -63,10 +59,22 @@ class TestJsonLoader:
 
     def test_load_from_string_invalid(self) -> None:
         """Test loading invalid JSON string."""
-        with pytest.raises(JsonLoaderError) as exc_info:
+        with pytest.raises(JsonLoaderError, match="Invalid JSON"):
             JsonLoader.load_from_string("{ invalid json }")
 
-        assert "Invalid JSON" in str(exc_info.value)
+    def test_load_from_string_invalid_message(self) -> None:
+        """Test that the invalid JSON message is not prefixed twice."""
+        with pytest.raises(JsonLoaderError) as exc_info:
+            JsonLoader.load_from_string("not json")
+
+        assert str(exc_info.value) == "Invalid JSON: expected ident at line 1 column 2"
+
+    def test_load_from_string_validation_error(self) -> None:
+        """Test that well-formed JSON failing the schema is a validation error."""
+        json_string = json.dumps({"services": [{"name": ""}], "edges": []})
+
+        with pytest.raises(JsonLoaderError, match="Validation error"):
+            JsonLoader.load_from_string(json_string)
 
     def test_load_from_dict_success(self, sample_topology_dict: dict) -> None:
         """Test loading from dictionary."""
@@ -82,51 +90,36 @@ class TestJsonLoader:
             "edges": [],
         }
 
-        with pytest.raises(JsonLoaderError) as exc_info:
+        with pytest.raises(JsonLoaderError, match="Validation error"):
             JsonLoader.load_from_dict(invalid_dict)
 
-        assert "Validation error" in str(exc_info.value)
-
     def test_load_request_from_file_success(
-        self, sample_json_file: Path, sample_topology_dict: dict
+        self, tmp_path: Path, sample_topology_dict: dict
     ) -> None:
         """Test loading analyze request from file."""
-        # Create a request file
-        request_data = {
-            **sample_topology_dict,
-            "options": {"goal": "latency", "k": 3},
-        }
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False, encoding="utf-8"
-        ) as f:
-            json.dump(request_data, f)
-            temp_path = Path(f.name)
+        request_file = tmp_path / "request.json"
+        request_file.write_text(
+            json.dumps({**sample_topology_dict, "options": {"goal": "latency", "k": 3}}),
+            encoding="utf-8",
+        )
 
-        try:
-            request = JsonLoader.load_request_from_file(temp_path)
+        request = JsonLoader.load_request_from_file(request_file)
 
-            assert len(request.services) == 3
-            assert request.options.goal == "latency"
-        finally:
-            temp_path.unlink()
+        assert len(request.services) == 3
+        assert request.options.goal == "latency"
 
     def test_load_request_from_file_not_found(self) -> None:
         """Test loading request from non-existent file."""
-        with pytest.raises(JsonLoaderError) as exc_info:
+        with pytest.raises(JsonLoaderError, match="File not found"):
             JsonLoader.load_request_from_file("/nonexistent.json")
 
-        assert "File not found" in str(exc_info.value)
-
     def test_load_request_from_file_invalid_json(
         self, invalid_json_file: Path
     ) -> None:
         """Test loading request from invalid JSON file."""
-        with pytest.raises(JsonLoaderError) as exc_info:
+        with pytest.raises(JsonLoaderError, match="Invalid JSON"):
             JsonLoader.load_request_from_file(invalid_json_file)
 
-        assert "Invalid JSON" in str(exc_info.value)
-
     def test_load_request_from_string_success(self) -> None:
         """Test loading request from JSON string."""
         json_string = json.dumps({
@@ -142,10 +135,26 @@ class TestJsonLoader:
 
     def test_load_request_from_string_invalid(self) -> None:
         """Test loading request from invalid string."""
+        with pytest.raises(JsonLoaderError, match="Invalid JSON"):
+            JsonLoader.load_request_from_string("not json")
+
+    def test_load_request_from_string_invalid_message(self) -> None:
+        """Test that the invalid JSON message is not prefixed twice."""
         with pytest.raises(JsonLoaderError) as exc_info:
             JsonLoader.load_request_from_string("not json")
 
-        assert "Invalid JSON" in str(exc_info.value)
+        assert str(exc_info.value) == "Invalid JSON: expected ident at line 1 column 2"
+
+    def test_load_request_from_string_validation_error(self) -> None:
+        """Test that well-formed JSON failing the schema is a validation error."""
+        json_string = json.dumps({
+            "services": [{"name": "test"}],
+            "edges": [],
+            "options": {"goal": "invalid_goal"},
+        })
+
+        with pytest.raises(JsonLoaderError, match="Validation error"):
+            JsonLoader.load_request_from_string(json_string)
 
     def test_load_request_from_dict_success(
         self, analyze_request_dict: dict
@@ -164,20 +173,13 @@ class TestJsonLoader:
             "options": {"goal": "invalid_goal"},  # Invalid goal
         }
 
-        with pytest.raises(JsonLoaderError) as exc_info:
+        with pytest.raises(JsonLoaderError, match="Validation error"):
             JsonLoader.load_request_from_dict(invalid_dict)
 
-        assert "Validation error" in str(exc_info.value)
-
     def test_save_to_file(self, tmp_path: Path) -> None:
         """Test saving topology to file."""
-        topology = ServiceTopology(
-            services=[ServiceData(name="test-service")],
-            edges=[],
-        )
-
         output_file = tmp_path / "output.json"
-        JsonLoader.save_to_file(topology, output_file)
+        JsonLoader.save_to_file(SINGLE_SERVICE_TOPOLOGY, output_file)
 
         assert output_file.exists()
 
@@ -186,11 +188,11 @@ class TestJsonLoader:
             data = json.load(f)
 
         assert len(data["services"]) == 1
-        assert data["services"][0]["name"] == "test-service"
+        assert data["services"][0]["name"] == "test"
 
     def test_save_to_file_creates_directories(self, tmp_path: Path) -> None:
         """Test that save_to_file creates parent directories."""
-        topology = ServiceTopology(services=[], edges=[])
+        topology = ServiceTopology.model_construct(services=[], edges=[])
 
         output_file = tmp_path / "nested" / "deep" / "output.json"
         JsonLoader.save_to_file(topology, output_file)
@@ -199,13 +201,8 @@ class TestJsonLoader:
 
     def test_save_to_file_custom_indent(self, tmp_path: Path) -> None:
         """Test saving with custom indentation."""
-        topology = ServiceTopology(
-            services=[ServiceData(name="test")],
-            edges=[],
-        )
-
         output_file = tmp_path / "output.json"
-        JsonLoader.save_to_file(topology, output_file, indent=4)
+        JsonLoader.save_to_file(SINGLE_SERVICE_TOPOLOGY, output_file, indent=4)
 
         with open(output_file, encoding="utf-8") as f:
             content = f.read()
@@ -215,12 +212,7 @@ class TestJsonLoader:
 
     def test_to_json_string(self) -> None:
         """Test converting topology to JSON string."""
-        topology = ServiceTopology(
-            services=[ServiceData(name="test")],
-            edges=[],
-        )
-
-        json_string = JsonLoader.to_json_string(topology)
+        json_string = JsonLoader.to_json_string(SINGLE_SERVICE_TOPOLOGY)
 
         assert isinstance(json_string, str)
         data = json.loads(json_string)
@@ -228,24 +220,14 @@ class TestJsonLoader:
 
     def test_to_json_string_compact(self) -> None:
         """Test converting to compact JSON string."""
-        topology = ServiceTopology(
-            services=[ServiceData(name="test")],
-            edges=[],
-        )
-
-        json_string = JsonLoader.to_json_string(topology, indent=None)
+        json_string = JsonLoader.to_json_string(SINGLE_SERVICE_TOPOLOGY, indent=None)
 
         # Compact JSON should have no newlines in the middle
         assert "\n" not in json_string.strip()
 
     def test_to_json_string_custom_indent(self) -> None:
         """Test converting with custom indent."""
-        topology = ServiceTopology(
-            services=[ServiceData(name="test")],
-            edges=[],
-        )
-
-        json_string = JsonLoader.to_json_string(topology, indent=4)
+        json_string = JsonLoader.to_json_string(SINGLE_SERVICE_TOPOLOGY, indent=4)
 
         assert "    " in json_string  # 4-space indent
 
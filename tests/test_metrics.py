@@ -10,8 +10,15 @@ import pytest
 import networkx as nx
 
 from smallworld.core.graph_builder import GraphBuilder
-from smallworld.core.metrics import GraphMetrics, MetricsCalculator, NodeMetrics
-from smallworld.io.schemas import ServiceTopology
+from smallworld.core.metrics import (
+    GraphMetrics,
+    MetricsCalculator,
+    NodeMetrics,
+    average_weighted_path_length,
+    betweenness_centrality,
+    pagerank,
+)
+from smallworld.io.schemas import EdgeData, ServiceData, ServiceTopology
 
 
 class TestNodeMetrics:
@@ -120,10 +127,11 @@ class TestMetricsCalculator:
         assert graph_metrics.edge_count == 0
         assert len(node_metrics) == 0
 
-    def test_betweenness_centrality(self, chain_graph: nx.DiGraph) -> None:
+    def test_betweenness_centrality(
+        self, chain_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test betweenness centrality calculation for chain."""
-        calc = MetricsCalculator(graph=chain_graph)
-        _, node_metrics = calc.calculate_all()
+        _, node_metrics = chain_metrics
 
         # Middle nodes should have higher betweenness
         middle_betweenness = node_metrics["service_2"].betweenness_centrality
@@ -132,10 +140,11 @@ class TestMetricsCalculator:
         # In a chain, middle nodes have paths passing through them
         assert middle_betweenness >= end_betweenness
 
-    def test_in_out_degree(self, simple_graph: nx.DiGraph) -> None:
+    def test_in_out_degree(
+        self, simple_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test in/out degree calculation."""
-        calc = MetricsCalculator(graph=simple_graph)
-        _, node_metrics = calc.calculate_all()
+        _, node_metrics = simple_metrics
 
         # Gateway has 1 outgoing, 0 incoming
         assert node_metrics["gateway"].out_degree == 1
@@ -145,54 +154,60 @@ class TestMetricsCalculator:
         assert node_metrics["users"].out_degree == 0
         assert node_metrics["users"].in_degree == 1
 
-    def test_load_calculation(self, simple_graph: nx.DiGraph) -> None:
+    def test_load_calculation(
+        self, simple_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test load calculation based on call rates."""
-        calc = MetricsCalculator(graph=simple_graph)
-        _, node_metrics = calc.calculate_all()
+        _, node_metrics = simple_metrics
 
         # Auth receives calls from gateway (100.0 call_rate)
         assert node_metrics["auth"].incoming_load == 100.0
         # Auth sends calls to users (80.0 call_rate)
         assert node_metrics["auth"].outgoing_load == 80.0
 
-    def test_average_path_length(self, chain_graph: nx.DiGraph) -> None:
+    def test_average_path_length(
+        self, chain_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test average path length calculation."""
-        calc = MetricsCalculator(graph=chain_graph)
-        graph_metrics, _ = calc.calculate_all()
+        graph_metrics, _ = chain_metrics
 
         # Chain of 6 nodes should have significant path length
         assert graph_metrics.average_path_length > 0
 
-    def test_weighted_path_length(self, simple_graph: nx.DiGraph) -> None:
+    def test_weighted_path_length(
+        self, simple_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test weighted average path length calculation."""
-        calc = MetricsCalculator(graph=simple_graph)
-        graph_metrics, _ = calc.calculate_all()
+        graph_metrics, _ = simple_metrics
 
         # Weighted path length should be calculated
         assert graph_metrics.weighted_average_path_length >= 0
 
-    def test_clustering_coefficient(self, complex_graph: nx.DiGraph) -> None:
+    def test_clustering_coefficient(
+        self, complex_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test clustering coefficient calculation."""
-        calc = MetricsCalculator(graph=complex_graph)
-        graph_metrics, node_metrics = calc.calculate_all()
+        graph_metrics, node_metrics = complex_metrics
 
         # Check that clustering coefficients are calculated
         for nm in node_metrics.values():
             assert 0 <= nm.clustering_coefficient <= 1
 
-    def test_pagerank(self, complex_graph: nx.DiGraph) -> None:
+    def test_pagerank(
+        self, complex_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test PageRank calculation."""
-        calc = MetricsCalculator(graph=complex_graph)
-        _, node_metrics = calc.calculate_all()
+        _, node_metrics = complex_metrics
 
         # PageRank values should sum to approximately 1
         total_pagerank = sum(nm.pagerank for nm in node_metrics.values())
         assert abs(total_pagerank - 1.0) < 0.01
 
-    def test_density_calculation(self, simple_graph: nx.DiGraph) -> None:
+    def test_density_calculation(
+        self, simple_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test density calculation."""
-        calc = MetricsCalculator(graph=simple_graph)
-        graph_metrics, _ = calc.calculate_all()
+        graph_metrics, _ = simple_metrics
 
         # 3 nodes, 2 edges -> density = 2 / (3*2) = 0.333...
         expected_density = 2 / (3 * 2)
@@ -222,36 +237,40 @@ class TestMetricsCalculator:
         # Hub should be identified as hub
         assert node_metrics["hub"].is_hub is True
 
-    def test_bottleneck_identification(self, chain_graph: nx.DiGraph) -> None:
+    def test_bottleneck_identification(
+        self, chain_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test bottleneck identification."""
-        calc = MetricsCalculator(graph=chain_graph)
-        _, node_metrics = calc.calculate_all()
+        _, node_metrics = chain_metrics
 
         # At least one node should be marked as bottleneck in chain
         bottlenecks = [nm for nm in node_metrics.values() if nm.is_bottleneck]
         assert len(bottlenecks) >= 0  # May vary based on threshold
 
-    def test_vulnerability_score(self, complex_graph: nx.DiGraph) -> None:
+    def test_vulnerability_score(
+        self, complex_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test vulnerability score calculation."""
-        calc = MetricsCalculator(graph=complex_graph)
-        _, node_metrics = calc.calculate_all()
+        _, node_metrics = complex_metrics
 
         # Vulnerability scores should be non-negative
         for nm in node_metrics.values():
             assert nm.vulnerability_score >= 0
 
-    def test_small_world_coefficient(self, complex_graph: nx.DiGraph) -> None:
+    def test_small_world_coefficient(
+        self, complex_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test small-world coefficient calculation."""
-        calc = MetricsCalculator(graph=complex_graph)
-        graph_metrics, _ = calc.calculate_all()
+        graph_metrics, _ = complex_metrics
 
         # Coefficient should be calculated (may be 0 for small graphs)
         assert graph_metrics.small_world_coefficient >= 0
 
-    def test_diameter_calculation(self, chain_graph: nx.DiGraph) -> None:
+    def test_diameter_calculation(
+        self, chain_metrics: tuple[GraphMetrics, dict[str, NodeMetrics]]
+    ) -> None:
         """Test diameter calculation."""
-        calc = MetricsCalculator(graph=chain_graph)
-        graph_metrics, _ = calc.calculate_all()
+        graph_metrics, _ = chain_metrics
 
         # Diameter may be 0 for non-strongly-connected graphs
         assert graph_metrics.diameter >= 0
@@ -310,5 +329,118 @@ class TestMetricsCalculator:
         assert graph_metrics.strongly_connected_components == 1
 
 
-# Import for type hints
-from smallworld.io.schemas import EdgeData, ServiceData
+class TestBetweennessCentrality:
+    """Tests for the index-based Brandes implementation."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_networkx(self, seed: int) -> None:
+        """Test values match NetworkX on random directed graphs."""
+        graph = nx.gnp_random_graph(40, 0.08, directed=True, seed=seed)
+
+        expected = nx.betweenness_centrality(graph, normalized=True)
+        actual = betweenness_centrality(graph)
+
+        assert actual == pytest.approx(expected)
+
+    def test_matches_networkx_on_fixture(self, complex_graph: nx.DiGraph) -> None:
+        """Test values match NetworkX on a service topology."""
+        expected = nx.betweenness_centrality(complex_graph, normalized=True)
+
+        assert betweenness_centrality(complex_graph) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("edges", [[], [("a", "b")], [("a", "b"), ("b", "a")]])
+    def test_fewer_than_three_nodes(self, edges: list[tuple[str, str]]) -> None:
+        """Test graphs with no possible intermediate node report zero."""
+        graph = nx.DiGraph(edges)
+
+        assert betweenness_centrality(graph) == dict.fromkeys(graph, 0.0)
+
+
+class TestAverageWeightedPathLength:
+    """Tests for the index-based all-sources Dijkstra."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_networkx(self, seed: int) -> None:
+        """Test the mean matches per-source NetworkX Dijkstra."""
+        graph = nx.gnp_random_graph(40, 0.08, directed=True, seed=seed)
+        for i, (u, v) in enumerate(graph.edges()):
+            graph[u][v]["weight"] = 1.0 + (i % 7) * 0.5
+
+        lengths = [
+            length
+            for source in graph.nodes()
+            for target, length in nx.single_source_dijkstra_path_length(
+                graph, source, weight="weight"
+            ).items()
+            if source != target
+        ]
+
+        assert average_weighted_path_length(graph) == pytest.approx(
+            sum(lengths) / len(lengths)
+        )
+
+    def test_missing_weight_defaults_to_one(self) -> None:
+        """Test edges without a weight attribute count as length 1."""
+        graph = nx.DiGraph([("a", "b"), ("b", "c")])
+
+        # a->b = 1, b->c = 1, a->c = 2
+        assert average_weighted_path_length(graph) == pytest.approx(4 / 3)
+
+
+class TestPageRank:
+    """Tests for the NumPy power-iteration PageRank."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_ranks_sum_to_one(self, seed: int) -> None:
+        """Test ranks form a distribution on random graphs with zero weights."""
+        graph = nx.gnp_random_graph(40, 0.08, directed=True, seed=seed)
+        for u, v in graph.edges():
+            graph.edges[u, v]["weight"] = (u + v) % 4
+
+        ranks = pagerank(graph)
+
+        assert sum(ranks.values()) == pytest.approx(1.0)
+        assert min(ranks.values()) > 0
+
+    def test_uniform_on_cycle(self) -> None:
+        """Test every node of a directed cycle gets the same rank."""
+        ranks = pagerank(nx.cycle_graph(5, create_using=nx.DiGraph))
+
+        assert ranks == pytest.approx(dict.fromkeys(range(5), 0.2))
+
+    def test_dangling_target(self) -> None:
+        """Test a single edge into a dangling node matches the closed form."""
+        # r_a = 0.425 * r_b + 0.075 with r_a + r_b = 1 gives r_a = 20/57
+        ranks = pagerank(nx.DiGraph([("a", "b")]))
+
+        assert ranks == pytest.approx({"a": 20 / 57, "b": 37 / 57}, abs=1e-6)
+
+    def test_zero_weight_edge_is_dangling(self) -> None:
+        """Test a node whose only out-edge has zero weight spreads its rank uniformly."""
+        graph = nx.DiGraph()
+        graph.add_edge("a", "b", weight=0.0)
+
+        assert pagerank(graph) == pytest.approx({"a": 0.5, "b": 0.5})
+
+    def test_fixture_values(self, complex_graph: nx.DiGraph) -> None:
+        """Test the weighted service topology against known ranks."""
+        expected = {
+            "gateway": 0.076746,
+            "auth": 0.106398,
+            "users": 0.167184,
+            "orders": 0.112328,
+            "payments": 0.144945,
+            "inventory": 0.104026,
+            "notifications": 0.288373,
+        }
+
+        assert pagerank(complex_graph) == pytest.approx(expected, abs=1e-6)
+
+    def test_empty_graph(self) -> None:
+        """Test an empty graph has no scores."""
+        assert pagerank(nx.DiGraph()) == {}
+
+    def test_no_convergence_raises(self, complex_graph: nx.DiGraph) -> None:
+        """Test hitting max_iter raises like NetworkX."""
+        with pytest.raises(nx.PowerIterationFailedConvergence):
+            pagerank(complex_graph, max_iter=1)
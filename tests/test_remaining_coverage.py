@@ -3,129 +3,100 @@ Tests to cover remaining uncovered lines for 100% coverage.
 """
 
 import os
-import tempfile
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 import pytest
 import networkx as nx
 
+from smallworld.cli import app as cli_app
 from smallworld.core.metrics import MetricsCalculator
-from smallworld.core.shortcut_optimizer import ShortcutOptimizer, OptimizationGoal
 from smallworld.io.json_loader import JsonLoader, JsonLoaderError
 from smallworld.io.schemas import ServiceTopology
 
 
-class TestMetricsExceptionBranches:
-    """Test exception branches in metrics calculation."""
-
-    def test_betweenness_with_exception_raising_graph(self):
-        """Test betweenness when nx.betweenness_centrality raises."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
-
-        calc = MetricsCalculator(graph)
-
-        with patch.object(nx, 'betweenness_centrality', side_effect=Exception("Test error")):
-            graph_metrics, node_metrics = calc.calculate_all()
-
-            # Should use default values
-            assert node_metrics["a"].betweenness_centrality == 0.0
+def raise_error(*args, **kwargs):
+    """Stand-in for a NetworkX call that fails, used to reach fallback branches."""
+    raise Exception("Test error")
 
-    def test_closeness_with_exception_raising_graph(self):
-        """Test closeness when nx.closeness_centrality raises."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
-
-        calc = MetricsCalculator(graph)
-
-        with patch.object(nx, 'closeness_centrality', side_effect=Exception("Test error")):
-            graph_metrics, node_metrics = calc.calculate_all()
 
-            assert node_metrics["a"].closeness_centrality == 0.0
-
-    def test_clustering_with_exception(self):
-        """Test clustering when nx.clustering raises."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
-
-        calc = MetricsCalculator(graph)
+def raise_io_error(*args, **kwargs):
+    """Stand-in for open() on an unreadable or unwritable path."""
+    raise IOError("Disk unavailable")
 
-        with patch.object(nx, 'clustering', side_effect=Exception("Test error")):
-            graph_metrics, node_metrics = calc.calculate_all()
 
-            assert node_metrics["a"].clustering_coefficient == 0.0
+# Patched calls never touch the graph, so one calculator serves every fallback test
+@pytest.fixture(scope="module")
+def ab_calc() -> MetricsCalculator:
+    graph = nx.DiGraph()
+    graph.add_edge("a", "b")
+    return MetricsCalculator(graph)
 
-    def test_pagerank_with_exception(self):
-        """Test pagerank when nx.pagerank raises."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
-
-        calc = MetricsCalculator(graph)
-
-        with patch.object(nx, 'pagerank', side_effect=Exception("Test error")):
-            graph_metrics, node_metrics = calc.calculate_all()
-
-            # Should have fallback value
-            assert node_metrics["a"].pagerank >= 0
-
-    def test_average_clustering_with_exception(self):
-        """Test average clustering when nx.average_clustering raises."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
-
-        calc = MetricsCalculator(graph)
-
-        with patch.object(nx, 'average_clustering', side_effect=Exception("Test error")):
-            graph_metrics, node_metrics = calc.calculate_all()
-
-            assert graph_metrics.average_clustering == 0.0
-
-    def test_path_length_exception(self):
-        """Test path length when calculation raises."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
-
-        calc = MetricsCalculator(graph)
 
-        with patch.object(nx, 'single_source_shortest_path_length', side_effect=Exception("Test")):
-            graph_metrics, _ = calc.calculate_all()
+# Two-node cycle for the diameter fallback, which needs a strongly connected graph
+@pytest.fixture(scope="module")
+def ab_cycle_calc() -> MetricsCalculator:
+    graph = nx.DiGraph()
+    graph.add_edges_from([("a", "b"), ("b", "a")])
+    return MetricsCalculator(graph)
 
-            assert graph_metrics.average_path_length == 0.0
 
-    def test_weighted_path_length_exception(self):
-        """Test weighted path length when calculation raises."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b", weight=1.0)
-
-        calc = MetricsCalculator(graph)
-
-        with patch.object(nx, 'single_source_dijkstra_path_length', side_effect=Exception("Test")):
-            graph_metrics, _ = calc.calculate_all()
-
-            assert graph_metrics.weighted_average_path_length == 0.0
+class TestMetricsExceptionBranches:
+    """Test exception branches in metrics calculation."""
 
-    def test_diameter_exception(self):
+    @pytest.mark.parametrize(
+        ("target", "metric", "expected"),
+        [
+            pytest.param(
+                "smallworld.core.metrics.betweenness_centrality",
+                lambda g, n: n["a"].betweenness_centrality, 0.0, id="betweenness",
+            ),
+            pytest.param(
+                "networkx.closeness_centrality",
+                lambda g, n: n["a"].closeness_centrality, 0.0, id="closeness",
+            ),
+            pytest.param(
+                "networkx.clustering",
+                lambda g, n: n["a"].clustering_coefficient, 0.0, id="clustering",
+            ),
+            # Falls back to a uniform score over the two nodes
+            pytest.param(
+                "smallworld.core.metrics.pagerank",
+                lambda g, n: n["a"].pagerank, 0.5, id="pagerank",
+            ),
+            pytest.param(
+                "networkx.average_clustering",
+                lambda g, n: g.average_clustering, 0.0, id="average_clustering",
+            ),
+            pytest.param(
+                "networkx.single_source_shortest_path_length",
+                lambda g, n: g.average_path_length, 0.0, id="path_length",
+            ),
+            pytest.param(
+                "smallworld.core.metrics.average_weighted_path_length",
+                lambda g, n: g.weighted_average_path_length, 0.0, id="weighted_path_length",
+            ),
+        ],
+    )
+    def test_exception_falls_back_to_default(
+        self, ab_calc, monkeypatch, target, metric, expected
+    ):
+        """Test each metric falls back to its default when its calculation raises."""
+        monkeypatch.setattr(target, raise_error)
+        graph_metrics, node_metrics = ab_calc.calculate_all()
+
+        assert metric(graph_metrics, node_metrics) == expected
+
+    def test_diameter_exception(self, ab_cycle_calc, monkeypatch):
         """Test diameter when calculation raises exception."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
-        graph.add_edge("b", "a")
+        monkeypatch.setattr(nx, "diameter", raise_error)
+        monkeypatch.setattr(nx, "is_strongly_connected", lambda graph: True)
+        graph_metrics, _ = ab_cycle_calc.calculate_all()
 
-        calc = MetricsCalculator(graph)
-
-        with patch.object(nx, 'diameter', side_effect=Exception("Test")):
-            with patch.object(nx, 'is_strongly_connected', return_value=True):
-                graph_metrics, _ = calc.calculate_all()
+        assert graph_metrics.diameter == 0
 
-                assert graph_metrics.diameter == 0
-
-    def test_small_world_edge_cases(self):
+    def test_small_world_edge_cases(self, ab_calc):
         """Test small world coefficient edge cases."""
-        graph = nx.DiGraph()
         # Just 2 nodes - below n<3 threshold
-        graph.add_edge("a", "b")
-
-        calc = MetricsCalculator(graph)
-        graph_metrics, _ = calc.calculate_all()
+        graph_metrics, _ = ab_calc.calculate_all()
 
         # Should return 0 for small graphs
         assert graph_metrics.small_world_coefficient >= 0
@@ -133,8 +104,7 @@ class TestMetricsExceptionBranches:
     def test_small_world_with_zero_lambda(self):
         """Test small world coefficient when lambda_ratio is 0."""
         graph = nx.DiGraph()
-        for i in range(5):
-            graph.add_node(f"n{i}")
+        graph.add_nodes_from(f"n{i}" for i in range(5))
 
         calc = MetricsCalculator(graph)
         graph_metrics, _ = calc.calculate_all()
@@ -143,102 +113,60 @@ class TestMetricsExceptionBranches:
         assert graph_metrics.small_world_coefficient >= 0
 
 
-class TestOptimizerGoalEnum:
-    """Test optimizer with OptimizationGoal enum."""
-
-    def test_set_goal_with_enum_directly(self):
-        """Test setting goal with OptimizationGoal enum."""
-        graph = nx.DiGraph()
-        graph.add_edge("a", "b")
-
-        optimizer = ShortcutOptimizer(graph)
-        optimizer.set_goal(OptimizationGoal.LATENCY)
-
-        assert optimizer.goal == OptimizationGoal.LATENCY
-        assert optimizer.alpha == 2.0  # Latency weights
-
-
 class TestJsonLoaderIOErrors:
     """Test JSON loader IO error handling."""
 
-    def test_load_from_file_io_error(self):
+    def test_load_from_file_io_error(self, single_service_json_file, monkeypatch):
         """Test IOError when reading file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "test.json"
-            filepath.write_text('{"services": [], "edges": []}')
+        # Shadow open in the loader module only, leaving builtins untouched
+        monkeypatch.setattr("smallworld.io.json_loader.open", raise_io_error, raising=False)
 
-            # Mock open to raise IOError
-            with patch('builtins.open', side_effect=IOError("Cannot read")):
-                with pytest.raises(JsonLoaderError) as exc_info:
-                    JsonLoader.load_from_file(filepath)
+        with pytest.raises(JsonLoaderError, match="Cannot read file"):
+            JsonLoader.load_from_file(single_service_json_file)
 
-                assert "Cannot read file" in str(exc_info.value)
-
-    def test_save_to_file_io_error(self):
+    def test_save_to_file_io_error(self, monkeypatch):
         """Test IOError when writing file."""
-        topology = ServiceTopology(services=[], edges=[])
-
-        with patch('builtins.open', side_effect=IOError("Cannot write")):
-            with pytest.raises(JsonLoaderError) as exc_info:
-                JsonLoader.save_to_file(topology, Path("test.json"))
+        topology = ServiceTopology.model_construct(services=[], edges=[])
+        monkeypatch.setattr("smallworld.io.json_loader.open", raise_io_error, raising=False)
 
-            assert "Cannot write file" in str(exc_info.value)
+        with pytest.raises(JsonLoaderError, match="Cannot write file"):
+            JsonLoader.save_to_file(topology, Path("test.json"))
 
 
 class TestCLIExceptionHandling:
     """Test CLI exception handling paths."""
 
-    def test_analyze_with_json_loader_error(self):
+    def test_analyze_with_json_loader_error(self, runner, invalid_json_file):
         """Test analyze command with JsonLoaderError."""
-        from typer.testing import CliRunner
-        from smallworld.cli import app as cli_app
+        result = runner.invoke(cli_app, ["analyze", str(invalid_json_file)])
+        assert result.exit_code == 1
+        assert "Error" in result.output
 
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "invalid.json"
-            filepath.write_text("not valid json {{{")
-
-            result = runner.invoke(cli_app, ["analyze", str(filepath)])
-            assert result.exit_code == 1
-            assert "Error" in result.output
-
-    def test_analyze_with_general_exception(self):
+    def test_analyze_with_general_exception(self, runner, monkeypatch, single_service_json_file):
         """Test analyze command handles general exceptions."""
-        from typer.testing import CliRunner
-        from smallworld.cli import app as cli_app
-
-        runner = CliRunner()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "test.json"
-            filepath.write_text('{"services": [{"name": "a", "replicas": 1, "criticality": "medium"}], "edges": []}')
-
-            with patch('smallworld.cli.GraphBuilder.build_from_topology', side_effect=RuntimeError("Test error")):
-                result = runner.invoke(cli_app, ["analyze", str(filepath)])
-                assert result.exit_code == 1
+        monkeypatch.setattr("smallworld.cli.GraphBuilder.build_from_topology", raise_error)
+        result = runner.invoke(cli_app, ["analyze", str(single_service_json_file)])
+        assert result.exit_code == 1
 
 
 class TestAPIValueError:
     """Test API ValueError handling."""
 
-    def test_analyze_with_value_error(self):
+    def test_analyze_with_value_error(self, client, monkeypatch):
         """Test analyze endpoint with ValueError."""
-        from fastapi.testclient import TestClient
-        from smallworld.api.app import app
-
-        client = TestClient(app)
-
-        with patch('smallworld.api.app.GraphBuilder') as mock_builder:
-            mock_builder.return_value.build_from_dict.side_effect = ValueError("Invalid value")
-
-            response = client.post(
-                "/analyze",
-                json={
-                    "services": [{"name": "a", "replicas": 1, "tags": [], "criticality": "medium"}],
-                    "edges": [],
-                    "options": {"goal": "balanced", "k": 3},
-                },
-            )
-            assert response.status_code == 400
-            assert "Invalid value" in response.json()["error"]
+
+        def reject_topology(*args, **kwargs):
+            raise ValueError("Invalid value")
+
+        monkeypatch.setattr("smallworld.api.app.GraphBuilder.build_from_dict", reject_topology)
+
+        response = client.post(
+            "/analyze",
+            json={
+                "services": [{"name": "a", "replicas": 1, "tags": [], "criticality": "medium"}],
+                "edges": [],
+                "options": {"goal": "balanced", "k": 3},
+            },
+        )
+        assert response.status_code == 400
+        assert "Invalid value" in response.json()["error"]
@@ -47,7 +47,7 @@ class TestServiceData:
 
         assert service.name == "test-service"
         assert service.replicas == 1
-        assert service.tags == []
+        assert service.tags == ()
         assert service.criticality == CriticalityLevel.MEDIUM
 
     def test_full_service(self) -> None:
@@ -62,43 +62,47 @@ class TestServiceData:
 
         assert service.name == "auth-service"
         assert service.replicas == 3
-        assert "critical" in service.tags
+        assert service.tags == ("critical", "auth")
         assert service.zone == "us-east-1"
 
-    def test_name_validation_empty(self) -> None:
-        """Test that empty name is rejected."""
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param({"name": ""}, id="empty_name"),
+            pytest.param({"name": "   "}, id="whitespace_name"),
+            pytest.param({"name": "service@invalid"}, id="special_chars"),
+            pytest.param({"name": "test", "replicas": -1}, id="negative_replicas"),
+        ],
+    )
+    def test_invalid_service_rejected(self, fields: dict) -> None:
+        """Test that invalid service fields are rejected."""
         with pytest.raises(ValidationError):
-            ServiceData(name="")
-
-    def test_name_validation_whitespace(self) -> None:
-        """Test that whitespace-only name is rejected."""
-        with pytest.raises(ValidationError):
-            ServiceData(name="   ")
-
-    def test_name_validation_special_chars(self) -> None:
-        """Test that special characters are rejected."""
-        with pytest.raises(ValidationError):
-            ServiceData(name="service@invalid")
-
-    def test_name_validation_allowed_chars(self) -> None:
-        """Test that allowed characters work."""
-        service = ServiceData(name="my-service_v1.0")
-        assert service.name == "my-service_v1.0"
-
-    def test_name_trimmed(self) -> None:
-        """Test that name is trimmed."""
-        service = ServiceData(name="  trimmed  ")
-        assert service.name == "trimmed"
+            ServiceData(**fields)
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            pytest.param("my-service_v1.0", "my-service_v1.0", id="allowed_chars"),
+            pytest.param("  trimmed  ", "trimmed", id="trimmed"),
+        ],
+    )
+    def test_name_normalized(self, name: str, expected: str) -> None:
+        """Test that allowed names are accepted and trimmed."""
+        assert ServiceData(name=name).name == expected
 
     def test_replicas_zero(self) -> None:
         """Test that zero replicas is allowed."""
         service = ServiceData(name="test", replicas=0)
         assert service.replicas == 0
 
-    def test_replicas_negative(self) -> None:
-        """Test that negative replicas is rejected."""
+    def test_frozen_and_hashable(self) -> None:
+        """Test that services are immutable and usable as dict keys."""
+        service = ServiceData(name="test", tags=["a"])
+
         with pytest.raises(ValidationError):
-            ServiceData(name="test", replicas=-1)
+            service.replicas = 5
+
+        assert hash(service) == hash(ServiceData(name="test", tags=["a"]))
 
 
 class TestEdgeData:
@@ -145,30 +149,36 @@ class TestEdgeData:
         assert edge.p50_latency == 10.0
         assert edge.p95_latency == 50.0
 
-    def test_empty_source(self) -> None:
-        """Test that empty source is rejected."""
-        with pytest.raises(ValidationError):
-            EdgeData(source="", target="b")
-
-    def test_empty_target(self) -> None:
-        """Test that empty target is rejected."""
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param({"source": "", "target": "b"}, id="empty_source"),
+            pytest.param({"source": "a", "target": ""}, id="empty_target"),
+            pytest.param({"source": "a", "target": "b", "call_rate": -1.0}, id="negative_call_rate"),
+            pytest.param({"source": "a", "target": "b", "error_rate": 1.5}, id="error_rate_above_one"),
+        ],
+    )
+    def test_invalid_edge_rejected(self, fields: dict) -> None:
+        """Test that invalid edge fields are rejected."""
         with pytest.raises(ValidationError):
-            EdgeData(source="a", target="")
+            EdgeData(**fields)
 
-    def test_negative_call_rate(self) -> None:
-        """Test that negative call rate is rejected."""
-        with pytest.raises(ValidationError):
-            EdgeData(source="a", target="b", call_rate=-1.0)
-
-    def test_error_rate_bounds(self) -> None:
-        """Test error rate must be 0-1."""
-        # Valid
+    def test_error_rate_in_bounds(self) -> None:
+        """Test error rate within 0-1 is accepted."""
         edge = EdgeData(source="a", target="b", error_rate=0.5)
         assert edge.error_rate == 0.5
 
-        # Invalid > 1
+    def test_self_loop_rejected_after_strip(self) -> None:
+        """Test that names are compared after whitespace is stripped."""
+        with pytest.raises(ValidationError, match="Self-loop"):
+            EdgeData.model_validate({"from": " a ", "to": "a"})
+
+    def test_frozen(self) -> None:
+        """Test that edges cannot be mutated after validation."""
+        edge = EdgeData(source="a", target="b")
+
         with pytest.raises(ValidationError):
-            EdgeData(source="a", target="b", error_rate=1.5)
+            edge.target = "a"
 
 
 class TestServiceTopology:
@@ -198,14 +208,12 @@ class TestServiceTopology:
 
     def test_self_loop_rejected(self) -> None:
         """Test that self-loops are rejected."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Self-loop"):
             ServiceTopology(
                 services=[ServiceData(name="a")],
                 edges=[EdgeData(source="a", target="a")],
             )
 
-        assert "Self-loop" in str(exc_info.value)
-
 
 class TestOptimizationOptions:
     """Tests for OptimizationOptions schema."""
@@ -232,33 +240,29 @@ class TestOptimizationOptions:
         assert options.k == 10
         assert options.alpha == 2.0
 
-    def test_invalid_goal(self) -> None:
-        """Test that invalid goal is rejected."""
-        with pytest.raises(ValidationError):
-            OptimizationOptions(goal="invalid")
-
     def test_goal_case_insensitive(self) -> None:
         """Test that goal validation is case insensitive."""
         options = OptimizationOptions(goal="LATENCY")
         assert options.goal == "latency"
 
-    def test_k_bounds(self) -> None:
-        """Test k value bounds."""
-        # Min
-        options = OptimizationOptions(k=1)
-        assert options.k == 1
-
-        # Max
-        options = OptimizationOptions(k=100)
-        assert options.k == 100
-
-        # Below min
-        with pytest.raises(ValidationError):
-            OptimizationOptions(k=0)
-
-        # Above max
+    @pytest.mark.parametrize("k", [1, 100])
+    def test_k_in_bounds(self, k: int) -> None:
+        """Test k accepts both ends of its range."""
+        assert OptimizationOptions(k=k).k == k
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param({"goal": "invalid"}, id="invalid_goal"),
+            pytest.param({"k": 0}, id="k_below_min"),
+            pytest.param({"k": 101}, id="k_above_max"),
+            pytest.param({"alpha": -1.0}, id="negative_alpha"),
+        ],
+    )
+    def test_invalid_options_rejected(self, fields: dict) -> None:
+        """Test that invalid optimization options are rejected."""
         with pytest.raises(ValidationError):
-            OptimizationOptions(k=101)
+            OptimizationOptions(**fields)
 
 
 class TestPolicyConfig:
@@ -318,6 +322,14 @@ class TestAnalyzeRequest:
         assert request.policy is not None
         assert request.policy.require_same_zone is True
 
+    def test_self_loop_rejected(self) -> None:
+        """Test that self-loops are rejected in requests, not only topologies."""
+        with pytest.raises(ValidationError):
+            AnalyzeRequest.model_validate({
+                "services": [{"name": "a"}],
+                "edges": [{"from": "a", "to": "a"}],
+            })
+
 
 class TestNodeMetricsResponse:
     """Tests for NodeMetricsResponse schema."""